@@ -0,0 +1,70 @@
+"""
+Admission control for long-lived API connections such as SSE streams.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Optional
+
+
+class AdmissionSlot:
+    """A single admitted connection; releasing it more than once is a no-op."""
+
+    __slots__ = ("_controller", "_released")
+
+    def __init__(self, controller: "AdmissionController") -> None:
+        self._controller = controller
+        self._released = False
+
+    async def release(self) -> None:
+        if self._released:
+            return
+        self._released = True
+        await self._controller._release()
+
+
+class AdmissionController:
+    """Counter guarded by an ``asyncio.Condition`` capping concurrent admissions."""
+
+    def __init__(self, c_max: int) -> None:
+        self._c_max = c_max
+        self._active = 0
+        self._condition = asyncio.Condition()
+
+    @property
+    def active(self) -> int:
+        return self._active
+
+    @property
+    def c_max(self) -> int:
+        return self._c_max
+
+    async def try_acquire(self) -> Optional[AdmissionSlot]:
+        """Admit immediately if below the cap, otherwise return ``None``."""
+        async with self._condition:
+            if self._active >= self._c_max:
+                return None
+            self._active += 1
+            return AdmissionSlot(self)
+
+    async def acquire(self) -> AdmissionSlot:
+        """Wait until a slot is available."""
+        async with self._condition:
+            await self._condition.wait_for(lambda: self._active < self._c_max)
+            self._active += 1
+            return AdmissionSlot(self)
+
+    async def resize(self, c_max: int) -> None:
+        """Change the cap; waiters are re-evaluated against the new limit."""
+        async with self._condition:
+            self._c_max = c_max
+            self._condition.notify_all()
+
+    async def _release(self) -> None:
+        async with self._condition:
+            self._active -= 1
+            self._condition.notify(1)
+
+
+__all__ = ["AdmissionController", "AdmissionSlot"]
@@ -0,0 +1,36 @@
+"""
+Helpers for HTTP conditional requests (``ETag`` / ``If-None-Match``).
+"""
+
+from __future__ import annotations
+
+import hashlib
+from typing import Any
+
+from fastapi import Request, Response, status
+
+
+def weak_etag(*parts: Any) -> str:
+    """Build a weak validator from the identifying parts of a resource version."""
+    digest = hashlib.blake2b(
+        "|".join(str(part) for part in parts).encode("utf-8"), digest_size=8
+    ).hexdigest()
+    return f'W/"{digest}"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """Return True when the client already holds the supplied ``etag``."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    return etag in {candidate.strip() for candidate in header.split(",")}
+
+
+def not_modified(etag: str) -> Response:
+    """Empty ``304 Not Modified`` response carrying the current validator."""
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
+
+__all__ = ["etag_matches", "not_modified", "weak_etag"]
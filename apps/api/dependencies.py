@@ -0,0 +1,70 @@
+"""
+Shared FastAPI dependencies for the API routers.
+"""
+
+from __future__ import annotations
+
+from typing import Optional
+
+from core.jobs.service import JobService, get_job_service as _get_core_job_service
+from core.tickets import TicketService, TicketSettingsService
+from core.watchers import WatcherService
+
+_ticket_service: Optional[TicketService] = None
+_ticket_settings_service: Optional[TicketSettingsService] = None
+_watcher_service: Optional[WatcherService] = None
+
+
+def get_job_service() -> JobService:
+    """Return the app-wide ``JobService`` instance, creating it on first use.
+
+    The instance is owned by ``core.jobs.service`` so routers outside this
+    package share it without importing ``apps``.
+    """
+    return _get_core_job_service()
+
+
+def get_ticket_settings_service() -> TicketSettingsService:
+    """Return the app-wide ``TicketSettingsService`` instance."""
+    global _ticket_settings_service
+    if _ticket_settings_service is None:
+        _ticket_settings_service = TicketSettingsService()
+    return _ticket_settings_service
+
+
+def get_ticket_service() -> TicketService:
+    """Return the app-wide ``TicketService`` instance.
+
+    It shares the job and toggle services above, so toggle updates made through
+    the API are seen by ticket creation without waiting on a separate cache.
+    """
+    global _ticket_service
+    if _ticket_service is None:
+        _ticket_service = TicketService(
+            job_service=get_job_service(),
+            settings_service=get_ticket_settings_service(),
+        )
+    return _ticket_service
+
+
+def get_watcher_service() -> WatcherService:
+    """Return the app-wide ``WatcherService`` instance."""
+    global _watcher_service
+    if _watcher_service is None:
+        _watcher_service = WatcherService()
+    return _watcher_service
+
+
+async def close_services() -> None:
+    """Release resources held by services created during the app's lifetime."""
+    if _ticket_service is not None:
+        await _ticket_service.close()
+
+
+__all__ = [
+    "close_services",
+    "get_job_service",
+    "get_ticket_service",
+    "get_ticket_settings_service",
+    "get_watcher_service",
+]
@@ -11,8 +11,7 @@ from typing import AsyncGenerator
 
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.middleware.gzip import GZipMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 from prometheus_client import make_asgi_app
 
 from core.config import settings
@@ -21,7 +20,10 @@ from core.logging import setup_logging
 from core.metrics import setup_metrics
 from core.security import setup_security
 from core.jobs.event_bus import job_event_bus
+from core.jobs.notify_listener import job_notify_listener
+from core.jobs.pubsub_hub import job_event_hub
 from core.watchers.event_bus import watcher_event_bus
+from apps.api.dependencies import close_services, get_job_service
 from apps.api.routers import (
     auth,
     conversation,
@@ -33,7 +35,12 @@ from apps.api.routers import (
     tickets,
     watcher,
 )
-from apps.api.middleware import SecurityMiddleware, RateLimitMiddleware, RequestLoggingMiddleware
+from apps.api.middleware import (
+    RateLimitMiddleware,
+    RequestLoggingMiddleware,
+    SecurityMiddleware,
+    StreamingGZipMiddleware,
+)
 
 # Setup logging
 setup_logging()
@@ -47,6 +54,9 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     
     # Initialize database
     await init_db()
+
+    # Create the shared job service before the first request needs it
+    get_job_service()
     
     # Setup metrics
     setup_metrics()
@@ -58,8 +68,11 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     
     # Cleanup
     logger.info("Shutting down RCA Engine API...")
+    await close_services()
     await close_db()
+    await job_event_hub.close()
     await job_event_bus.close()
+    await job_notify_listener.close()
     await watcher_event_bus.close()
 
 
@@ -71,6 +84,7 @@ app = FastAPI(
     docs_url="/api/docs" if settings.DEBUG else None,
     redoc_url="/api/redoc" if settings.DEBUG else None,
     openapi_url="/api/openapi.json" if settings.DEBUG else None,
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
@@ -84,8 +98,8 @@ app.add_middleware(
     allow_headers=security_settings.CORS_ALLOW_HEADERS,
 )
 
-# Add compression
-app.add_middleware(GZipMiddleware, minimum_size=1000)
+# Add compression; SSE responses are flushed per frame so streams stay live
+app.add_middleware(StreamingGZipMiddleware, minimum_size=1000)
 
 # Add request logging and security middleware
 app.add_middleware(RequestLoggingMiddleware)
@@ -8,6 +8,7 @@ implementation simply re-exports the richer security middlewares that live in
 
 from __future__ import annotations
 
+from apps.api.middleware.gzip import StreamingGZipMiddleware
 from core.security.middleware import (
     SecurityHeadersMiddleware as _SecurityHeadersMiddleware,
     RateLimitMiddleware as _RateLimitMiddleware,
@@ -21,4 +22,9 @@ class SecurityMiddleware(_SecurityHeadersMiddleware):
 
 RateLimitMiddleware = _RateLimitMiddleware
 
-__all__ = ["SecurityMiddleware", "RateLimitMiddleware", "RequestLoggingMiddleware"]
+__all__ = [
+    "SecurityMiddleware",
+    "RateLimitMiddleware",
+    "RequestLoggingMiddleware",
+    "StreamingGZipMiddleware",
+]
@@ -0,0 +1,20 @@
+"""
+Response helpers for endpoints that return already-trusted models.
+"""
+
+from __future__ import annotations
+
+from fastapi import Response, status
+from pydantic import BaseModel
+
+
+def model_response(model: BaseModel, status_code: int = status.HTTP_200_OK) -> Response:
+    """Serialise ``model`` in pydantic-core, skipping response_model revalidation."""
+    return Response(
+        content=model.model_dump_json(),
+        status_code=status_code,
+        media_type="application/json",
+    )
+
+
+__all__ = ["model_response"]
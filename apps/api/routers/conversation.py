@@ -6,13 +6,13 @@ from __future__ import annotations
 
 from typing import Any, Dict, List, Optional
 
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, status
 from pydantic import BaseModel, Field
 
+from apps.api.dependencies import get_job_service
 from core.jobs.service import JobService
 
 router = APIRouter()
-job_service = JobService()
 
 
 class ConversationTurnModel(BaseModel):
@@ -35,10 +35,12 @@ class ConversationResponse(BaseModel):
 
 
 @router.get("/{job_id}", response_model=ConversationResponse)
-async def get_conversation(job_id: str) -> ConversationResponse:
+async def get_conversation(
+    job_id: str,
+    job_service: JobService = Depends(get_job_service),
+) -> ConversationResponse:
     """Return the persisted LLM conversation for a job."""
-    job = await job_service.get_job(job_id)
-    if job is None:
+    if await job_service.get_job_owner(job_id) is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Job not found")
 
     turns = await job_service.get_conversation(job_id)
@@ -24,6 +24,7 @@ from pydantic import BaseModel, Field, UUID4, validator
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from apps.api.dependencies import get_job_service
 from core.config import settings
 from core.db.database import get_db
 from core.db.models import File as FileModel, User
@@ -33,7 +34,6 @@ from core.security.auth import get_current_user
 from core.metrics import MetricsCollector
 
 router = APIRouter()
-job_service = JobService()
 file_service = FileService()
 
 class SupportedFileTypesResponse(BaseModel):
@@ -121,17 +121,18 @@ async def upload_file(
     file: UploadFile = UploadDependency(...),
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
+    job_service: JobService = Depends(get_job_service),
 ) -> FileResponse:
     """Persist an uploaded file and attach it to the specified job."""
-    job = await job_service.get_job(str(job_id))
-    if job is None:
+    owner = await job_service.get_job_owner(job_id)
+    if owner is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Job not found",
         )
 
     user_id = str(current_user.id)
-    if job.user_id != user_id and not current_user.is_superuser:
+    if owner != user_id and not current_user.is_superuser:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Not permitted to upload files for this job",
@@ -167,17 +168,18 @@ async def list_job_files(
     job_id: UUID4,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
+    job_service: JobService = Depends(get_job_service),
 ) -> List[FileResponse]:
     """List files that were uploaded for a job."""
-    job = await job_service.get_job(str(job_id))
-    if job is None:
+    owner = await job_service.get_job_owner(job_id)
+    if owner is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Job not found",
         )
 
     user_id = str(current_user.id)
-    if job.user_id != user_id and not current_user.is_superuser:
+    if owner != user_id and not current_user.is_superuser:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Not permitted to access files for this job",
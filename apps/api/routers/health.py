@@ -4,30 +4,59 @@ Health check endpoints for the API.
 
 from __future__ import annotations
 
-from fastapi import APIRouter
+import asyncio
+import json
+import time
+from typing import Tuple
+
+from fastapi import APIRouter, Response
 
 from core.config import settings
 from core.db.database import db_manager
 
 router = APIRouter()
 
-
-@router.get("/live")
-async def liveness() -> dict:
-    """Simple liveness probe."""
-    return {
+# The liveness payload never changes for the lifetime of the process.
+_LIVENESS_BODY = json.dumps(
+    {
         "status": "ok",
         "app": settings.APP_NAME,
         "version": settings.APP_VERSION,
     }
+).encode("utf-8")
+
+# Back-to-back readiness probes share one database round-trip.
+READINESS_CACHE_TTL_SECONDS = 2.0
+_readiness_lock = asyncio.Lock()
+_readiness_cache: Tuple[float, bool] = (0.0, False)
+
+
+@router.get("/live")
+async def liveness() -> Response:
+    """Simple liveness probe."""
+    return Response(content=_LIVENESS_BODY, media_type="application/json")
+
+
+async def _database_ready() -> bool:
+    """Return the database health, re-checked at most every few seconds."""
+    global _readiness_cache
+    if not db_manager.is_initialized:
+        return False
+
+    async with _readiness_lock:
+        expires_at, healthy = _readiness_cache
+        if expires_at > time.monotonic():
+            return healthy
+
+        healthy = await db_manager.health_check()
+        _readiness_cache = (time.monotonic() + READINESS_CACHE_TTL_SECONDS, healthy)
+        return healthy
 
 
 @router.get("/ready")
 async def readiness() -> dict:
     """Report whether critical dependencies are ready."""
-    healthy = False
-    if db_manager.is_initialized:
-        healthy = await db_manager.health_check()
+    healthy = await _database_ready()
     return {
         "status": "ready" if healthy else "starting",
         "database": healthy,
@@ -37,7 +66,7 @@ async def readiness() -> dict:
 
 # Kubernetes-style aliases
 @router.get("/healthz")
-async def healthz() -> dict:
+async def healthz() -> Response:
     """Kubernetes-style liveness probe alias."""
     return await liveness()
 
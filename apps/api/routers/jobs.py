@@ -7,83 +7,22 @@ create, list, and inspect background jobs while the richer workflow evolves.
 
 from __future__ import annotations
 
+import base64
+import binascii
+import uuid
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import List, Optional, Tuple
 
-from fastapi import APIRouter, HTTPException, Query, status
-from pydantic import BaseModel, Field
-from starlette.responses import EventSourceResponse
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
 
-from apps.api.routers.sse import _event_stream as job_event_stream
-from core.db.models import Job, JobEvent
+from apps.api.conditional import etag_matches, not_modified, weak_etag
+from apps.api.dependencies import get_job_service
+from apps.api.routers.sse import _event_stream as job_event_stream, admit_stream, sse_response
+from apps.api.schemas.jobs import JobCreateRequest, JobEventResponse, JobResponse
 from core.jobs.service import JobService
 
 router = APIRouter()
-job_service = JobService()
-
-
-class JobCreateRequest(BaseModel):
-    """Payload required to create a new job."""
-
-    user_id: str = Field(default="anonymous", description="Identifier for the job owner")
-    job_type: str = Field(..., description="Type of job, e.g. rca_analysis")
-    input_manifest: Dict[str, Any] = Field(default_factory=dict, description="Job specific payload")
-    provider: str = Field(default="ollama")
-    model: str = Field(default="llama2")
-    priority: int = Field(default=0, ge=0, le=10)
-    model_config: Optional[Dict[str, Any]] = Field(
-        default=None, description="Provider/model tuning overrides"
-    )
-    ticketing: Optional[Dict[str, Any]] = Field(
-        default=None, description="Per-job ITSM configuration"
-    )
-    source: Optional[Dict[str, Any]] = Field(
-        default=None, description="Origin metadata (e.g. watcher path)"
-    )
-
-
-class JobResponse(BaseModel):
-    """Projection of a job for API responses."""
-
-    id: str
-    job_type: str
-    status: str
-    user_id: str
-    provider: str
-    model: str
-    model_config: Optional[Dict[str, Any]] = None
-    input_manifest: Optional[Dict[str, Any]] = None
-    priority: int
-    retry_count: int
-    max_retries: int
-    created_at: Optional[str] = None
-    updated_at: Optional[str] = None
-    started_at: Optional[str] = None
-    completed_at: Optional[str] = None
-    duration_seconds: Optional[float] = None
-    result_data: Optional[Dict[str, Any]] = None
-    outputs: Optional[Dict[str, Any]] = None
-    ticketing: Optional[Dict[str, Any]] = None
-    source: Optional[Dict[str, Any]] = None
-    error_message: Optional[str] = None
-
-    @classmethod
-    def from_orm(cls, job: Job) -> "JobResponse":
-        return cls(**job.to_dict())
-
-
-class JobEventResponse(BaseModel):
-    """Serialised representation of a job event."""
-
-    id: str
-    job_id: str
-    event_type: str
-    data: Optional[Dict[str, Any]]
-    created_at: Optional[str] = None
-
-    @classmethod
-    def from_orm(cls, event: JobEvent) -> "JobEventResponse":
-        return cls(**event.to_dict())
 
 
 def _parse_iso_timestamp(value: Optional[str]) -> Optional[datetime]:
@@ -100,8 +39,28 @@ def _parse_iso_timestamp(value: Optional[str]) -> Optional[datetime]:
         ) from exc
 
 
+def _encode_cursor(key: Tuple[datetime, uuid.UUID]) -> str:
+    created_at, job_id = key
+    raw = f"{created_at.isoformat()}|{job_id}".encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii")
+
+
+def _decode_cursor(cursor: str) -> Tuple[datetime, uuid.UUID]:
+    try:
+        created_at, job_id = base64.urlsafe_b64decode(cursor).decode("utf-8").split("|")
+        return datetime.fromisoformat(created_at), uuid.UUID(job_id)
+    except (binascii.Error, UnicodeDecodeError, ValueError) as exc:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="Invalid pagination cursor",
+        ) from exc
+
+
 @router.post("/", status_code=status.HTTP_201_CREATED, response_model=JobResponse)
-async def create_job(payload: JobCreateRequest) -> JobResponse:
+async def create_job(
+    payload: JobCreateRequest,
+    job_service: JobService = Depends(get_job_service),
+) -> JobResponse:
     """Queue a new job for processing."""
     job = await job_service.create_job(
         user_id=payload.user_id,
@@ -110,7 +69,7 @@ async def create_job(payload: JobCreateRequest) -> JobResponse:
         provider=payload.provider,
         model=payload.model,
         priority=payload.priority,
-        model_config=payload.model_config,
+        model_config=payload.llm_config,
         ticketing=payload.ticketing,
         source=payload.source,
     )
@@ -118,11 +77,21 @@ async def create_job(payload: JobCreateRequest) -> JobResponse:
 
 
 @router.get("/{job_id}", response_model=JobResponse)
-async def get_job(job_id: str) -> JobResponse:
+async def get_job(
+    job_id: str,
+    request: Request,
+    response: Response,
+    job_service: JobService = Depends(get_job_service),
+) -> JobResponse:
     """Fetch details of a specific job."""
     job = await job_service.get_job(job_id)
     if job is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Job not found")
+
+    etag = weak_etag(job.id, job.updated_at or job.created_at)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    response.headers["ETag"] = etag
     return JobResponse.from_orm(job)
 
 
@@ -131,16 +100,26 @@ async def list_jobs(
     user_id: Optional[str] = Query(None),
     status_filter: Optional[str] = Query(None, alias="status"),
     limit: int = Query(50, ge=1, le=200),
-    offset: int = Query(0, ge=0),
-) -> List[JobResponse]:
-    """List jobs optionally filtered by user and/or status."""
-    jobs = await job_service.get_user_jobs(
+    offset: int = Query(0, ge=0, deprecated=True),
+    cursor: Optional[str] = Query(None, description="Value of a previous page's X-Next-Cursor header"),
+    job_service: JobService = Depends(get_job_service),
+) -> Response:
+    """List jobs optionally filtered by user and/or status.
+
+    Pages are chained through the ``X-Next-Cursor`` response header; ``offset``
+    is still honoured when no cursor is given.
+    """
+    projections, last_key = await job_service.get_user_job_projections(
         user_id=user_id,
         status=status_filter,
         limit=limit,
         offset=offset,
+        before=_decode_cursor(cursor) if cursor else None,
     )
-    return [JobResponse.from_orm(job) for job in jobs]
+    response = Response(content="[" + ",".join(projections) + "]", media_type="application/json")
+    if last_key is not None and len(projections) == limit:
+        response.headers["X-Next-Cursor"] = _encode_cursor(last_key)
+    return response
 
 
 @router.get("/{job_id}/events", response_model=List[JobEventResponse])
@@ -148,14 +127,15 @@ async def job_events(
     job_id: str,
     since: Optional[str] = Query(None, description="ISO timestamp from which to stream events"),
     limit: int = Query(100, ge=1, le=500),
+    job_service: JobService = Depends(get_job_service),
 ) -> List[JobEventResponse]:
     """Return recent events for the given job."""
-    job = await job_service.get_job(job_id)
-    if job is None:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Job not found")
-
     since_dt = _parse_iso_timestamp(since)
-    events = await job_service.get_job_events_since(job_id, since_dt)
+    job_status, events = await job_service.get_job_status_and_new_events(
+        job_id, since=since_dt, limit=None
+    )
+    if job_status is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Job not found")
     if not events:
         return []
 
@@ -165,12 +145,18 @@ async def job_events(
 
 
 @router.get("/{job_id}/stream")
-async def stream_job_events(job_id: str) -> EventSourceResponse:
+async def stream_job_events(
+    job_id: str,
+    since: Optional[str] = Query(None, description="Only replay events after this ISO timestamp"),
+    job_service: JobService = Depends(get_job_service),
+) -> StreamingResponse:
     """Stream job events via server-sent events (alias for PRD compatibility)."""
+    since_dt = _parse_iso_timestamp(since)
     job = await job_service.get_job(job_id)
     if job is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Job not found")
-    return EventSourceResponse(job_event_stream(job_id))
+    slot = await admit_stream()
+    return sse_response(job_event_stream(job_id, job_service, job.status, since_dt, slot), slot)
 
 
 __all__ = ["router"]
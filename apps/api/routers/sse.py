@@ -4,124 +4,239 @@ Server Sent Event helpers for streaming job updates.
 
 from __future__ import annotations
 
-import contextlib
 import asyncio
-import json
 import logging
+import uuid
+from collections import OrderedDict
 from datetime import datetime, timezone
-from typing import Any, AsyncGenerator, Dict, Optional, Tuple
-
-from fastapi import APIRouter, HTTPException, status
-from starlette.responses import EventSourceResponse
-
+from typing import Any, AsyncGenerator, Dict, Optional, Tuple, Union
+
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, Field
+
+from apps.api.admission import AdmissionController, AdmissionSlot
+from apps.api.dependencies import get_job_service
+from apps.api.routers.auth import get_current_active_superuser
+from core.config import settings
+from core.db.models import TERMINAL_JOB_STATUSES, User
+from core.logging import job_id_context
+from core.sse import SSE_HEADERS, format_sse, sse_response
 from core.jobs.service import JobService
-from core.jobs.event_bus import job_event_bus
+from core.jobs.pubsub_hub import job_event_hub
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
-job_service = JobService()
-
-
-TERMINAL_STATES = {"completed", "failed", "cancelled"}
-
-
-async def _event_stream(job_id: str) -> AsyncGenerator[Dict[str, str], None]:
-    """Yield SSE payloads backed by the in-process/Redis event bus."""
-
-    queue: asyncio.Queue[Tuple[str, Dict[str, Any]]] = asyncio.Queue()
-    stop_event = asyncio.Event()
-
-    async def _forward_events() -> None:
-        try:
-            async for payload in job_event_bus.subscribe(job_id):
-                await queue.put(("event", payload))
-        except asyncio.CancelledError:
-            raise
-        except Exception as exc:  # pragma: no cover - transport issues
-            logger.warning("SSE subscription lost for job %s: %s", job_id, exc)
-        finally:
-            await queue.put(("closed", {}))
-            stop_event.set()
-
-    async def _emit_heartbeats() -> None:
-        while not stop_event.is_set():
-            await asyncio.sleep(15)
-            job = await job_service.get_job(job_id)
-            data = {
-                "job_id": job_id,
-                "timestamp": datetime.now(timezone.utc).isoformat(),
-                "status": getattr(job, "status", None),
-            }
-            await queue.put(("heartbeat", data))
-
-
-            if job and job.status in TERMINAL_STATES:
-                await queue.put(
-                    (
-                        "event",
-                        {
-                            "event_type": "complete",
-                            "job_id": job_id,
-                            "status": job.status,
-                        },
-                    )
-                )
-                stop_event.set()
-                await queue.put(("closed", {}))
-                break
-
-    consumer_task = asyncio.create_task(_forward_events())
-    heartbeat_task = asyncio.create_task(_emit_heartbeats())
 
-    try:
-        historical = await job_service.get_job_events(job_id, limit=50)
-        for event in reversed(historical):
-            payload = event.to_dict()
-            yield {
-                "event": payload.get("event_type", "message"),
-                "data": json.dumps(payload),
-            }
-
-        while True:
-            kind, payload = await queue.get()
-
-            if kind == "event":
-                event_type = payload.get("event_type", "message")
-                yield {
-                    "event": event_type,
-                    "data": json.dumps(payload),
-                }
+# Caps concurrently open job streams across this process; see admit_stream().
+stream_admission = AdmissionController(settings.SSE_MAX_CONCURRENCY)
+
+
+TERMINAL_STATES = TERMINAL_JOB_STATUSES
+
+# Look-back window for suppressing events delivered by both the history replay
+# and the live subscription.
+SEEN_EVENT_LIMIT = 512
+
+# Upper bound accepted for the runtime stream cap.
+MAX_STREAM_CONCURRENCY = 100_000
+
+
+class StreamConcurrencyResponse(BaseModel):
+    """Current stream admission cap and open stream count."""
+
+    c_max: int
+    active: int
+
+
+class StreamConcurrencyUpdate(BaseModel):
+    """New cap for concurrently open streams."""
+
+    c_max: int = Field(..., ge=1, le=MAX_STREAM_CONCURRENCY)
 
-                if event_type in TERMINAL_STATES or payload.get("status") in TERMINAL_STATES:
-                    stop_event.set()
 
-            elif kind == "heartbeat":
-                yield {
-                    "event": "heartbeat",
-                    "data": json.dumps(payload),
+async def admit_stream() -> AdmissionSlot:
+    """Reserve a stream slot or reject the request with ``503``."""
+    slot = await stream_admission.try_acquire()
+    if slot is None:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Too many concurrent streams",
+        )
+    return slot
+
+
+def _status_after(
+    event_type: str, data: Optional[Dict[str, Any]], current: Optional[str]
+) -> Optional[str]:
+    """Track job status from the lifecycle events flowing through the stream."""
+    # Status updates carry the new status in the event's ``data``.
+    if isinstance(data, dict) and data.get("status"):
+        return data["status"]
+    if event_type == "started":
+        return "running"
+    if event_type in TERMINAL_STATES:
+        return event_type
+    return current
+
+
+async def _event_stream(
+    job_id: str,
+    job_service: JobService,
+    job_status: Optional[str] = None,
+    since: Optional[datetime] = None,
+    slot: Optional[AdmissionSlot] = None,
+) -> AsyncGenerator[bytes, None]:
+    """Yield SSE frames for a job from the shared event hub."""
+    job_id_context.set(job_id)
+
+    # Subscribe before reading history and cap the replay at the subscription
+    # time: later events arrive through the queue instead of both paths.
+    queue = job_event_hub.subscribe(job_id)
+    subscribed_at = datetime.now(timezone.utc)
+    heartbeat = job_event_hub.heartbeat()
+    get_task: Optional[asyncio.Task] = None
+    tick_task: Optional[asyncio.Task] = None
+    seen_event_ids: "OrderedDict[str, None]" = OrderedDict()
+
+    # ``(created_at, id)`` of the newest event sent, for the final catch-up.
+    last_seen: Optional[Tuple[Union[datetime, str], str]] = None
+
+    try:
+        historical = await job_service.get_job_events(
+            job_id, limit=50, since=since, until=subscribed_at, order="asc"
+        )
+        for event in historical:
+            seen_event_ids[str(event.id)] = None
+            last_seen = (event.created_at, str(event.id))
+            event_type = event.event_type or "message"
+            yield format_sse(event_type, event.data_json or orjson.dumps(event.to_dict()))
+            job_status = _status_after(event_type, event.data, job_status)
+
+        # The job may have finished between the route's lookup and subscribing,
+        # leaving its terminal event only in the database.
+        job_status = await job_service.get_job_status(job_id) or job_status
+
+        while job_status not in TERMINAL_STATES:
+            if get_task is None:
+                get_task = asyncio.create_task(queue.get())
+            if tick_task is None:
+                tick_task = asyncio.create_task(heartbeat.wait())
+
+            done, _ = await asyncio.wait(
+                {get_task, tick_task}, return_when=asyncio.FIRST_COMPLETED
+            )
+
+            if tick_task in done:
+                tick_task = None
+                data = {
+                    "job_id": job_id,
+                    "timestamp": datetime.now(timezone.utc).isoformat(),
+                    "status": job_status,
                 }
+                yield format_sse("heartbeat", orjson.dumps(data))
+
+            if get_task in done:
+                kind, payload, data = get_task.result()
+                get_task = None
+                if queue.dropped:
+                    yield format_sse("lag", orjson.dumps({"dropped": queue.dropped}))
+                    queue.dropped = 0
+                if kind == "closed":
+                    return
+                if kind == "status":
+                    # The hub's per-job status check saw the job finish, e.g.
+                    # in a worker whose events never reached this process.
+                    job_status = payload["status"]
+                    continue
+
+                event_id = payload.get("id")
+                if event_id is not None:
+                    if event_id in seen_event_ids:
+                        continue
+                    seen_event_ids[event_id] = None
+                    if len(seen_event_ids) > SEEN_EVENT_LIMIT:
+                        seen_event_ids.popitem(last=False)
+                    if payload.get("created_at"):
+                        last_seen = (payload["created_at"], event_id)
 
-            elif kind == "closed":
-                break
+                event_type = payload.get("event_type", "message")
+                yield format_sse(event_type, data)
+                job_status = _status_after(event_type, payload.get("data"), job_status)
+
+        # Send whatever the subscription did not deliver before completing.
+        if last_seen is not None:
+            created_at, last_id = last_seen
+            if isinstance(created_at, str):
+                created_at = datetime.fromisoformat(created_at)
+            _, missed = await job_service.get_job_status_and_new_events(
+                job_id, since=created_at, after_id=uuid.UUID(last_id), limit=None
+            )
+        else:
+            _, missed = await job_service.get_job_status_and_new_events(
+                job_id, since=since, limit=None
+            )
+        for event in missed:
+            if str(event.id) in seen_event_ids:
+                continue
+            yield format_sse(
+                event.event_type or "message",
+                event.data_json or orjson.dumps(event.to_dict()),
+            )
+
+        complete = {"event_type": "complete", "job_id": job_id, "status": job_status}
+        yield format_sse("complete", orjson.dumps(complete))
     finally:
-        stop_event.set()
-        consumer_task.cancel()
-        heartbeat_task.cancel()
-        with contextlib.suppress(asyncio.CancelledError):
-            await consumer_task
-        with contextlib.suppress(asyncio.CancelledError):
-            await heartbeat_task
+        job_event_hub.unsubscribe(job_id, queue)
+        for task in (get_task, tick_task):
+            if task is not None:
+                task.cancel()
+        if slot is not None:
+            await slot.release()
 
 
 @router.get("/jobs/{job_id}")
-async def stream_job(job_id: str) -> EventSourceResponse:
+async def stream_job(
+    job_id: str,
+    since: Optional[datetime] = Query(None, description="Only replay events after this timestamp"),
+    job_service: JobService = Depends(get_job_service),
+) -> StreamingResponse:
     """Stream lifecycle events for the specified job."""
     job = await job_service.get_job(job_id)
     if job is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Job not found")
 
-    return EventSourceResponse(_event_stream(job_id))
+    slot = await admit_stream()
+    return sse_response(_event_stream(job_id, job_service, job.status, since, slot), slot)
+
+
+@router.get("/settings/concurrency", response_model=StreamConcurrencyResponse)
+async def get_stream_concurrency(
+    _: User = Depends(get_current_active_superuser),
+) -> StreamConcurrencyResponse:
+    """Return the stream admission cap."""
+    return StreamConcurrencyResponse(
+        c_max=stream_admission.c_max, active=stream_admission.active
+    )
+
+
+@router.put("/settings/concurrency", response_model=StreamConcurrencyResponse)
+async def update_stream_concurrency(
+    payload: StreamConcurrencyUpdate,
+    _: User = Depends(get_current_active_superuser),
+) -> StreamConcurrencyResponse:
+    """Change the stream admission cap without a restart.
+
+    Lowering the cap does not close open streams; new ones are rejected until
+    enough of them finish.
+    """
+    await stream_admission.resize(payload.c_max)
+    logger.info("Stream admission cap set to %s", payload.c_max)
+    return StreamConcurrencyResponse(
+        c_max=stream_admission.c_max, active=stream_admission.active
+    )
 
 
-__all__ = ["router"]
+__all__ = ["SSE_HEADERS", "admit_stream", "format_sse", "router", "sse_response", "stream_admission"]
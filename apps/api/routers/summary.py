@@ -6,13 +6,14 @@ from __future__ import annotations
 
 from typing import Any, Dict, Optional
 
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 from pydantic import BaseModel, Field
 
+from apps.api.conditional import etag_matches, not_modified, weak_etag
+from apps.api.dependencies import get_job_service
 from core.jobs.service import JobService
 
 router = APIRouter()
-job_service = JobService()
 
 
 class OutputBundle(BaseModel):
@@ -35,7 +36,12 @@ class JobSummaryResponse(BaseModel):
 
 
 @router.get("/{job_id}", response_model=JobSummaryResponse)
-async def get_summary(job_id: str) -> JobSummaryResponse:
+async def get_summary(
+    job_id: str,
+    request: Request,
+    response: Response,
+    job_service: JobService = Depends(get_job_service),
+) -> JobSummaryResponse:
     """Return the latest RCA outputs for the requested job."""
     job = await job_service.get_job(job_id)
     if job is None:
@@ -48,6 +54,13 @@ async def get_summary(job_id: str) -> JobSummaryResponse:
             detail="Summary outputs not available for this job",
         )
 
+    # Outputs only change alongside ``updated_at``, so polling dashboards can
+    # revalidate without re-downloading the rendered bundle.
+    etag = weak_etag(job.id, job.updated_at or job.completed_at)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    response.headers["ETag"] = etag
+
     result = job.result_data or {}
 
     bundle = OutputBundle(
@@ -6,17 +6,16 @@ from __future__ import annotations
 
 from typing import Any, Dict, List, Literal, Optional
 
-from fastapi import APIRouter, HTTPException, Query, status
-from pydantic import BaseModel, Field, UUID4
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from pydantic import BaseModel, Field, TypeAdapter, UUID4
 
-from core.jobs.service import JobService
-from core.tickets import TicketService, TicketSettingsService
+from apps.api.conditional import etag_matches, not_modified, weak_etag
+from apps.api.dependencies import get_ticket_service, get_ticket_settings_service
+from apps.api.responses import model_response
+from core.tickets import JobNotFoundError, TicketService, TicketSettingsService
 from core.tickets.settings import TicketToggleState
 
 router = APIRouter()
-job_service = JobService()
-ticket_service = TicketService()
-settings_service = TicketSettingsService()
 
 
 class TicketResponse(BaseModel):
@@ -43,6 +42,12 @@ class TicketListResponse(BaseModel):
     tickets: List[TicketResponse]
 
 
+class TicketDispatchResponse(TicketListResponse):
+    """Tickets created by a dispatch and the error of each failed platform."""
+
+    errors: Dict[str, str] = Field(default_factory=dict)
+
+
 class TicketCreateRequest(BaseModel):
     """Payload for ticket creation or dry-run preview."""
 
@@ -81,15 +86,30 @@ class TicketToggleUpdateRequest(BaseModel):
     dual_mode: Optional[bool] = None
 
 
+# Built once so ticket lists are converted in a single pydantic-core pass
+# instead of one Python-level model construction per ticket.
+_TICKETS_ADAPTER = TypeAdapter(List[TicketResponse])
+
+
 def _serialise_ticket(ticket) -> TicketResponse:
-    ticket_dict = ticket.to_dict()
-    ticket_dict["payload"] = ticket_dict.get("payload") or {}
-    ticket_dict["metadata"] = ticket_dict.get("metadata") or {}
-    return TicketResponse(**ticket_dict)
+    # Rows come from our own ORM model, so skip re-validating outbound data.
+    return TicketResponse.model_construct(**ticket.to_dict())
+
+
+def _ticket_list_response(
+    job_id: str, tickets, status_code: int = status.HTTP_200_OK
+) -> Response:
+    return model_response(
+        TicketListResponse.model_construct(
+            job_id=job_id,
+            tickets=_TICKETS_ADAPTER.validate_python([t.to_dict() for t in tickets]),
+        ),
+        status_code=status_code,
+    )
 
 
 def _serialise_toggle_state(state: TicketToggleState) -> TicketToggleResponse:
-    return TicketToggleResponse(
+    return TicketToggleResponse.model_construct(
         servicenow_enabled=state.servicenow_enabled,
         jira_enabled=state.jira_enabled,
         dual_mode=state.dual_mode,
@@ -97,55 +117,80 @@ def _serialise_toggle_state(state: TicketToggleState) -> TicketToggleResponse:
 
 
 @router.post("/", response_model=TicketResponse, status_code=status.HTTP_201_CREATED)
-async def create_ticket(payload: TicketCreateRequest) -> TicketResponse:
+async def create_ticket(
+    payload: TicketCreateRequest,
+    ticket_service: TicketService = Depends(get_ticket_service),
+) -> TicketResponse:
     """Create or record a ticket preview for a job."""
-    job_id = str(payload.job_id)
-    job = await job_service.get_job(job_id)
-    if job is None:
+    try:
+        ticket = await ticket_service.create_ticket(
+            job_id=payload.job_id,
+            platform=payload.platform,
+            payload=payload.payload,
+            profile_name=payload.profile_name,
+            dry_run=payload.dry_run,
+            ticket_id=payload.ticket_id,
+            url=payload.url,
+            metadata=payload.metadata,
+        )
+    except JobNotFoundError:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Job not found")
-
-    ticket = await ticket_service.create_ticket(
-        job_id=job_id,
-        platform=payload.platform,
-        payload=payload.payload,
-        profile_name=payload.profile_name,
-        dry_run=payload.dry_run,
-        ticket_id=payload.ticket_id,
-        url=payload.url,
-        metadata=payload.metadata,
-    )
     return _serialise_ticket(ticket)
 
 
-@router.post("/dispatch", response_model=TicketListResponse, status_code=status.HTTP_201_CREATED)
-async def dispatch_tickets(payload: TicketDispatchRequest) -> TicketListResponse:
+@router.post(
+    "/dispatch",
+    response_model=None,
+    status_code=status.HTTP_201_CREATED,
+    responses={status.HTTP_201_CREATED: {"model": TicketDispatchResponse}},
+)
+async def dispatch_tickets(
+    payload: TicketDispatchRequest,
+    ticket_service: TicketService = Depends(get_ticket_service),
+) -> Response:
     """Create tickets for all enabled platforms in a single call."""
-    job_id = str(payload.job_id)
-    job = await job_service.get_job(job_id)
-    if job is None:
+    try:
+        result = await ticket_service.create_enabled_tickets(
+            job_id=payload.job_id,
+            payloads=payload.payloads,
+            profile_name=payload.profile_name,
+            dry_run=payload.dry_run,
+        )
+    except JobNotFoundError:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Job not found")
-
-    tickets = await ticket_service.create_enabled_tickets(
-        job_id=job_id,
-        payloads=payload.payloads,
-        profile_name=payload.profile_name,
-        dry_run=payload.dry_run,
-    )
-    return TicketListResponse(
-        job_id=job_id,
-        tickets=[_serialise_ticket(ticket) for ticket in tickets],
+    if result.errors and not result.tickets:
+        raise HTTPException(status_code=status.HTTP_502_BAD_GATEWAY, detail=result.errors)
+    return model_response(
+        TicketDispatchResponse.model_construct(
+            job_id=str(payload.job_id),
+            tickets=_TICKETS_ADAPTER.validate_python([t.to_dict() for t in result.tickets]),
+            errors=result.errors,
+        ),
+        status_code=status.HTTP_201_CREATED,
     )
 
 
 @router.get("/settings/state", response_model=TicketToggleResponse)
-async def get_toggle_state() -> TicketToggleResponse:
+async def get_toggle_state(
+    request: Request,
+    response: Response,
+    settings_service: TicketSettingsService = Depends(get_ticket_settings_service),
+) -> TicketToggleResponse:
     """Return the persisted ITSM feature toggle configuration."""
     state = await settings_service.get_settings()
+    # The toggle state is its own version: three booleans, no timestamp.
+    etag = weak_etag(state.servicenow_enabled, state.jira_enabled, state.dual_mode)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    response.headers["ETag"] = etag
     return _serialise_toggle_state(state)
 
 
 @router.put("/settings/state", response_model=TicketToggleResponse)
-async def update_toggle_state(payload: TicketToggleUpdateRequest) -> TicketToggleResponse:
+async def update_toggle_state(
+    payload: TicketToggleUpdateRequest,
+    settings_service: TicketSettingsService = Depends(get_ticket_settings_service),
+) -> TicketToggleResponse:
     """Update the ITSM feature toggle configuration."""
     state = await settings_service.update_settings(
         servicenow_enabled=payload.servicenow_enabled,
@@ -155,18 +200,22 @@ async def update_toggle_state(payload: TicketToggleUpdateRequest) -> TicketToggl
     return _serialise_toggle_state(state)
 
 
-@router.get("/{job_id}", response_model=TicketListResponse)
-async def list_tickets(job_id: str, refresh: bool = Query(False)) -> TicketListResponse:
+@router.get(
+    "/{job_id}",
+    response_model=None,
+    responses={status.HTTP_200_OK: {"model": TicketListResponse}},
+)
+async def list_tickets(
+    job_id: UUID4,
+    refresh: bool = Query(False),
+    ticket_service: TicketService = Depends(get_ticket_service),
+) -> Response:
     """Return tickets linked to a job."""
-    job = await job_service.get_job(job_id)
-    if job is None:
+    try:
+        tickets = await ticket_service.list_job_tickets(job_id, refresh=refresh)
+    except JobNotFoundError:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Job not found")
-
-    tickets = await ticket_service.list_job_tickets(job_id, refresh=refresh)
-    return TicketListResponse(
-        job_id=job_id,
-        tickets=[_serialise_ticket(ticket) for ticket in tickets],
-    )
+    return _ticket_list_response(str(job_id), tickets)
 
 
 __all__ = ["router"]
@@ -6,19 +6,27 @@ from __future__ import annotations
 
 import asyncio
 import contextlib
-import json
+import time
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 
-from fastapi import APIRouter, HTTPException, Query, status
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
-from starlette.responses import EventSourceResponse
 
+from apps.api.conditional import etag_matches, not_modified, weak_etag
+from apps.api.dependencies import get_watcher_service
+from apps.api.responses import model_response
+from core.sse import format_sse, sse_response
 from core.watchers import WatcherService, watcher_event_bus
 
 router = APIRouter()
-watcher_service = WatcherService()
 
+HEARTBEAT_INTERVAL_SECONDS = 15.0
+
+# (epoch second, heartbeat frame) shared by every stream ticking that second.
+_heartbeat_cache: Tuple[int, bytes] = (-1, b"")
 
 
 class WatcherConfigModel(BaseModel):
@@ -51,7 +59,8 @@ class WatcherConfigUpdate(BaseModel):
 
 
 def _to_config_model(config) -> WatcherConfigModel:
-    return WatcherConfigModel(
+    # Built from our own persisted row, so field validation is skipped.
+    return WatcherConfigModel.model_construct(
         id=str(config.id),
         enabled=config.enabled,
         roots=list(config.roots or []),
@@ -66,15 +75,32 @@ def _to_config_model(config) -> WatcherConfigModel:
     )
 
 
-@router.get("/config", response_model=WatcherConfigModel)
-async def get_config() -> WatcherConfigModel:
+@router.get(
+    "/config",
+    response_model=None,
+    responses={status.HTTP_200_OK: {"model": WatcherConfigModel}},
+)
+async def get_config(
+    request: Request,
+    watcher_service: WatcherService = Depends(get_watcher_service),
+) -> Response:
     """Return the watcher configuration."""
     config = await watcher_service.get_config()
-    return _to_config_model(config)
+    # Every update bumps ``updated_at``, so polling dashboards can revalidate
+    # without the config being serialised again.
+    etag = weak_etag(config.id, config.updated_at or config.created_at)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    response = model_response(_to_config_model(config))
+    response.headers["ETag"] = etag
+    return response
 
 
 @router.put("/config", response_model=WatcherConfigModel)
-async def update_config(payload: WatcherConfigUpdate) -> WatcherConfigModel:
+async def update_config(
+    payload: WatcherConfigUpdate,
+    watcher_service: WatcherService = Depends(get_watcher_service),
+) -> WatcherConfigModel:
     """Update watcher configuration."""
     if payload is None:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="No payload supplied")
@@ -83,88 +109,82 @@ async def update_config(payload: WatcherConfigUpdate) -> WatcherConfigModel:
 
 
 @router.get("/status")
-async def watcher_status() -> Dict[str, Any]:
+async def watcher_status(
+    watcher_service: WatcherService = Depends(get_watcher_service),
+) -> Dict[str, Any]:
     """Return watcher subsystem status metrics."""
     return await watcher_service.get_status()
 
 
-async def _watcher_event_stream(history: int):
-    queue: asyncio.Queue[tuple[str, Dict[str, Any]]] = asyncio.Queue()
-    stop_event = asyncio.Event()
-
-    async def _forward_events() -> None:
-        try:
-            async for payload in watcher_event_bus.subscribe():
-                await queue.put(("event", payload))
-        except asyncio.CancelledError:
-            raise
-        except Exception as exc:  # pragma: no cover - defensive
-            await queue.put(
-                (
-                    "event",
-                    {
-                        "event_type": "error",
-                        "error": str(exc),
-                        "timestamp": datetime.now(timezone.utc).isoformat(),
-                    },
-                )
-            )
-        finally:
-            await queue.put(("closed", {}))
-            stop_event.set()
-
-    async def _emit_heartbeats() -> None:
-        while not stop_event.is_set():
-            await asyncio.sleep(15)
-            heartbeat = {
-                "timestamp": datetime.now(timezone.utc).isoformat(),
-            }
-            await queue.put(("heartbeat", heartbeat))
-
-
-    forward_task = asyncio.create_task(_forward_events())
-    heartbeat_task = asyncio.create_task(_emit_heartbeats())
+def _heartbeat_frame() -> bytes:
+    """Return the heartbeat SSE frame, encoded at most once per second."""
+    global _heartbeat_cache
+    second = time.time_ns() // 1_000_000_000
+    if _heartbeat_cache[0] != second:
+        timestamp = datetime.fromtimestamp(second, timezone.utc).isoformat()
+        _heartbeat_cache = (
+            second,
+            format_sse("heartbeat", orjson.dumps({"timestamp": timestamp})),
+        )
+    return _heartbeat_cache[1]
+
+
+async def _watcher_event_stream(
+    history: int, watcher_service: WatcherService
+) -> AsyncIterator[bytes]:
+    events = watcher_event_bus.subscribe_envelopes()
+    # Start pulling from the subscription before replaying history so events
+    # published meanwhile are not lost.
+    next_event: Optional[asyncio.Future] = asyncio.ensure_future(events.__anext__())
 
     try:
         if history:
-            events = await watcher_service.list_recent_events(history)
-            for event in events:
-                payload = event.to_dict()
-                yield {
-                    "event": payload.get("event_type", "history"),
-                    "data": json.dumps(payload),
-                }
+            frames = await watcher_service.list_recent_event_frames(history)
+            for event_type, data in frames:
+                yield format_sse(event_type or "history", data)
 
         while True:
-            kind, payload = await queue.get()
-            if kind == "event":
-                yield {
-                    "event": payload.get("event_type", "message"),
-                    "data": json.dumps(payload),
-                }
-            elif kind == "heartbeat":
-                yield {
-                    "event": "heartbeat",
-                    "data": json.dumps(payload),
+            if next_event is None:
+                next_event = asyncio.ensure_future(events.__anext__())
+
+            # ``asyncio.wait`` leaves the pending read alone on timeout, unlike
+            # ``wait_for`` which would cancel it and close the subscription.
+            done, _ = await asyncio.wait({next_event}, timeout=HEARTBEAT_INTERVAL_SECONDS)
+            if not done:
+                yield _heartbeat_frame()
+                continue
+
+            received, next_event = next_event, None
+            try:
+                envelope = received.result()
+            except StopAsyncIteration:
+                break
+            except Exception as exc:  # pragma: no cover - defensive
+                payload = {
+                    "event_type": "error",
+                    "error": str(exc),
+                    "timestamp": datetime.now(timezone.utc).isoformat(),
                 }
-            elif kind == "closed":
+                yield format_sse("error", orjson.dumps(payload))
                 break
+
+            # The bus already encoded this event once for all subscribers.
+            yield format_sse(envelope.payload.get("event_type", "message"), envelope.data)
     finally:
-        stop_event.set()
-        forward_task.cancel()
-        heartbeat_task.cancel()
-        with contextlib.suppress(asyncio.CancelledError):
-            await forward_task
-        with contextlib.suppress(asyncio.CancelledError):
-            await heartbeat_task
+        if next_event is not None:
+            next_event.cancel()
+            with contextlib.suppress(asyncio.CancelledError, StopAsyncIteration):
+                await next_event
+        await events.aclose()
 
 
 @router.get("/events")
 async def stream_events(
     history: int = Query(0, ge=0, le=200, description="Number of historical events to replay"),
-) -> EventSourceResponse:
+    watcher_service: WatcherService = Depends(get_watcher_service),
+) -> StreamingResponse:
     """Stream watcher events via server-sent events."""
-    return EventSourceResponse(_watcher_event_stream(history))
+    return sse_response(_watcher_event_stream(history, watcher_service))
 
 
 __all__ = ["router"]
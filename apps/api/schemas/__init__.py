@@ -0,0 +1,8 @@
+"""
+Shared request/response schemas for the API routers.
+"""
+
+from .base import APIModel
+from .jobs import JobCreateRequest, JobEventResponse, JobResponse
+
+__all__ = ["APIModel", "JobCreateRequest", "JobEventResponse", "JobResponse"]
@@ -0,0 +1,24 @@
+"""
+Common base model for API schemas.
+"""
+
+from __future__ import annotations
+
+from pydantic import BaseModel, ConfigDict
+
+
+class APIModel(BaseModel):
+    """Immutable base model shared by API request and response schemas."""
+
+    # ``protected_namespaces`` is cleared because job payloads expose
+    # provider ``model_*`` fields.
+
+    model_config = ConfigDict(
+        frozen=True,
+        from_attributes=True,
+        populate_by_name=True,
+        protected_namespaces=(),
+    )
+
+
+__all__ = ["APIModel"]
@@ -0,0 +1,82 @@
+"""
+Schemas for the jobs API.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, Optional
+
+from pydantic import Field
+
+from apps.api.schemas.base import APIModel
+from core.db.models import Job, JobEvent
+
+
+class JobCreateRequest(APIModel):
+    """Payload required to create a new job."""
+
+    user_id: str = Field(default="anonymous", description="Identifier for the job owner")
+    job_type: str = Field(..., description="Type of job, e.g. rca_analysis")
+    input_manifest: Dict[str, Any] = Field(default_factory=dict, description="Job specific payload")
+    provider: str = Field(default="ollama")
+    model: str = Field(default="llama2")
+    priority: int = Field(default=0, ge=0, le=10)
+    # ``model_config`` is reserved by pydantic, so the field is exposed via alias.
+    llm_config: Optional[Dict[str, Any]] = Field(
+        default=None,
+        alias="model_config",
+        description="Provider/model tuning overrides",
+    )
+    ticketing: Optional[Dict[str, Any]] = Field(
+        default=None, description="Per-job ITSM configuration"
+    )
+    source: Optional[Dict[str, Any]] = Field(
+        default=None, description="Origin metadata (e.g. watcher path)"
+    )
+
+
+class JobResponse(APIModel):
+    """Projection of a job for API responses."""
+
+    id: str
+    job_type: str
+    status: str
+    user_id: str
+    provider: str
+    model: str
+    llm_config: Optional[Dict[str, Any]] = Field(default=None, alias="model_config")
+    input_manifest: Optional[Dict[str, Any]] = None
+    priority: int
+    retry_count: int
+    max_retries: int
+    created_at: Optional[str] = None
+    updated_at: Optional[str] = None
+    started_at: Optional[str] = None
+    completed_at: Optional[str] = None
+    duration_seconds: Optional[float] = None
+    result_data: Optional[Dict[str, Any]] = None
+    outputs: Optional[Dict[str, Any]] = None
+    ticketing: Optional[Dict[str, Any]] = None
+    source: Optional[Dict[str, Any]] = None
+    error_message: Optional[str] = None
+
+    @classmethod
+    def from_orm(cls, job: Job) -> "JobResponse":
+        return cls(**job.to_dict())
+
+
+class JobEventResponse(APIModel):
+    """Serialised representation of a job event."""
+
+    id: str
+    job_id: str
+    event_type: str
+    data: Optional[Dict[str, Any]]
+    created_at: Optional[str] = None
+
+    @classmethod
+    def from_orm(cls, event: JobEvent) -> "JobEventResponse":
+        return cls(**event.to_dict())
+
+
+__all__ = ["JobCreateRequest", "JobEventResponse", "JobResponse"]
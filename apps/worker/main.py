@@ -5,11 +5,17 @@ Worker process for handling long-running RCA analysis jobs.
 
 import asyncio
 import logging
+import random
 import signal
 import sys
 from typing import Optional
 from uuid import uuid4
 
+try:
+    import uvloop
+except ImportError:  # pragma: no cover - uvloop is optional (not on Windows)
+    uvloop = None  # type: ignore[assignment]
+
 from core.config import settings
 from core.db.database import init_db, close_db
 from core.jobs.service import JobService
@@ -21,6 +27,21 @@ from core.metrics import setup_metrics
 setup_logging()
 logger = logging.getLogger(__name__)
 
+# Idle and error waits grow by this factor per consecutive empty poll, capped
+# at MAX_POLL_BACKOFF_SECONDS.
+POLL_BACKOFF_FACTOR = 1.2
+MAX_POLL_BACKOFF_SECONDS = 30.0
+
+
+def _poll_delay(attempt: int) -> float:
+    """Full-jitter backoff so worker replicas do not poll in lockstep."""
+    # The exponent is bounded so long idle stretches cannot overflow the float.
+    ceiling = min(
+        settings.WORKER_POLL_INTERVAL * POLL_BACKOFF_FACTOR ** min(attempt, 64),
+        MAX_POLL_BACKOFF_SECONDS,
+    )
+    return random.uniform(0, ceiling)
+
 
 class Worker:
     """RCA Engine Worker for processing analysis jobs."""
@@ -69,28 +90,27 @@ class Worker:
     async def _run_worker_loop(self):
         """Main worker loop for processing jobs."""
         logger.info("Worker loop started")
+        idle_polls = 0
         
         while self.running:
             try:
                 # Poll for pending jobs
-                job = await self.job_service.get_next_pending_job()
+                job = await self.job_service.get_next_pending_job(self.worker_id)
                 
                 if job:
+                    idle_polls = 0
                     logger.info(f"Processing job: {job.id}")
-                    await self.job_service.create_job_event(
-                        job.id,
-                        "worker-assigned",
-                        {"worker_id": self.worker_id},
-                    )
                     await self._process_job(job)
                 else:
-                    # No jobs available, wait before polling again
-                    await asyncio.sleep(settings.WORKER_POLL_INTERVAL)
+                    # No jobs available, back off before polling again
+                    await asyncio.sleep(_poll_delay(idle_polls))
+                    idle_polls += 1
                     
             except Exception as e:
                 logger.error(f"Error in worker loop: {e}", exc_info=True)
-                # Wait before retrying to avoid tight error loops
-                await asyncio.sleep(5)
+                # Back off before retrying to avoid tight error loops
+                await asyncio.sleep(_poll_delay(idle_polls))
+                idle_polls += 1
     
     async def _process_job(self, job):
         """Process a single job."""
@@ -122,6 +142,10 @@ async def main():
 
 
 if __name__ == "__main__":
+    # uvicorn[standard] already pulls in uvloop and the API server uses it
+    # automatically; the worker opts in explicitly for its database I/O.
+    if uvloop is not None:
+        uvloop.install()
     try:
         asyncio.run(main())
     except KeyboardInterrupt:
@@ -1,81 +1,193 @@
 """Jobs API router."""
 
 import asyncio
-import json
+import contextlib
+import logging
+import random
+import time
+import uuid
+from collections import deque
 from datetime import datetime
-from typing import AsyncGenerator, Callable, Optional, cast
+from typing import AsyncGenerator, Deque, Dict, Optional, Set, Tuple
 
+import orjson
 from fastapi import APIRouter, HTTPException, status
-from sqlalchemy import select
-from sqlalchemy.ext.asyncio import AsyncSession
-from starlette.responses import EventSourceResponse
+from fastapi.responses import StreamingResponse
 
-from core.db.database import get_db_session
-from core.db.models import Job, JobEvent
+from core.jobs.notify_listener import job_notify_listener
+from core.jobs.pubsub_hub import SubscriberQueue
+from core.jobs.service import get_job_service
+from core.logging import job_id_context
+from core.sse import format_sse, sse_response
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+POLL_INTERVAL_SECONDS = 1.0
+MAX_BACKOFF_SECONDS = 5.0
+# Events fetched per poll; a full batch means more may be waiting.
+POLL_BATCH_SIZE = 250
+# Broadcast frames a reader keeps for subscribers that join late.
+READER_HISTORY_LIMIT = 256
 
-async def _stream_job_events(
-    job_id: str,
-    session_factory: Callable[[], AsyncSession],
-) -> AsyncGenerator[str, None]:
-    """Stream job events for the given job ID."""
+
+async def _poll_job_events(job_id: str) -> AsyncGenerator[Tuple[bool, bytes], None]:
+    """Poll the database for new job events, yielding ``(is_heartbeat, chunk)``.
+
+    While the Postgres notification listener is available the poller sleeps
+    until a ``NOTIFY`` for the job arrives instead of querying on a timer.
+    """
     last_event_at: Optional[datetime] = None
+    last_event_id: Optional[uuid.UUID] = None
     heartbeat_interval = 15
-    last_heartbeat = datetime.utcnow()
+    last_heartbeat = time.monotonic()
     terminal_states = {"succeeded", "failed", "cancelled", "completed"}
+    backoff_seconds = POLL_INTERVAL_SECONDS
+    wakeup = await job_notify_listener.watch(job_id)
 
-    async with session_factory() as session:
-        session = cast(AsyncSession, session)
-
+    try:
         while True:
-            query = select(JobEvent).where(JobEvent.job_id == job_id)
-            if last_event_at is not None:
-                query = query.where(JobEvent.created_at > last_event_at)
-            query = query.order_by(JobEvent.created_at.asc())
-
-            result = await session.execute(query)
-            events = result.scalars().all()
+            if wakeup is not None:
+                # Cleared before querying so a notification raised while the
+                # query runs still triggers the next poll.
+                wakeup.clear()
+            try:
+                job_status, events = await get_job_service().get_job_status_and_new_events(
+                    job_id, since=last_event_at, after_id=last_event_id, limit=POLL_BATCH_SIZE
+                )
+            except Exception as exc:  # pragma: no cover - database issues
+                # Jitter the retry so readers for different jobs do not all hit
+                # the database at the same instant once it recovers.
+                backoff_seconds = min(backoff_seconds * 2, MAX_BACKOFF_SECONDS)
+                logger.warning("Polling job events failed, retrying in ~%.1fs: %s", backoff_seconds, exc)
+                await asyncio.sleep(backoff_seconds * (0.5 + random.random() * 0.5))
+                continue
+            backoff_seconds = POLL_INTERVAL_SECONDS
 
             if events:
                 for event in events:
-                    last_event_at = event.created_at
-                    payload = json.dumps(event.to_dict())
-                    yield f"event: {event.event_type}\ndata: {payload}\n\n"
+                    last_event_at, last_event_id = event.created_at, event.id
+                    payload = event.data_json or orjson.dumps(event.to_dict())
+                    yield False, format_sse(event.event_type, payload)
 
-                last_heartbeat = datetime.utcnow()
+                last_heartbeat = time.monotonic()
             else:
-                now = datetime.utcnow()
-                if (now - last_heartbeat).total_seconds() >= heartbeat_interval:
-                    heartbeat_payload = json.dumps({"timestamp": now.isoformat()})
-                    yield f"event: heartbeat\ndata: {heartbeat_payload}\n\n"
+                now = time.monotonic()
+                if now - last_heartbeat >= heartbeat_interval:
+                    heartbeat_payload = orjson.dumps({"timestamp": datetime.utcnow().isoformat()})
+                    yield True, format_sse("heartbeat", heartbeat_payload)
                     last_heartbeat = now
 
-            status_result = await session.execute(select(Job.status).where(Job.id == job_id))
-            job_status = status_result.scalar_one_or_none()
+            if len(events) >= POLL_BATCH_SIZE:
+                # Keep paging on the (created_at, id) key before trusting a
+                # terminal status, or the tail of a large backlog is lost.
+                continue
+
             if job_status in terminal_states:
                 break
 
-            if events:
+            if wakeup is not None and job_notify_listener.active:
+                # The timeout only paces heartbeats; new events and status
+                # changes wake the poller through NOTIFY.
+                timeout = max(0.0, last_heartbeat + heartbeat_interval - time.monotonic())
+                with contextlib.suppress(asyncio.TimeoutError):
+                    await asyncio.wait_for(wakeup.wait(), timeout=timeout)
+            elif events:
                 await asyncio.sleep(0.1)
             else:
-                await asyncio.sleep(1)
+                await asyncio.sleep(POLL_INTERVAL_SECONDS + random.uniform(-0.1, 0.1))
+    finally:
+        if wakeup is not None:
+            job_notify_listener.unwatch(job_id, wakeup)
+
+
+class _JobEventReader:
+    """Single database poller for a job, fanned out to every SSE subscriber."""
+
+    def __init__(self, job_id: str) -> None:
+        self.job_id = job_id
+        self._subscribers: Set[SubscriberQueue] = set()
+        # Recent events already broadcast, replayed to late subscribers. Only
+        # the newest READER_HISTORY_LIMIT are kept; older ones are reported to
+        # late subscribers as dropped.
+        self._history: Deque[bytes] = deque(maxlen=READER_HISTORY_LIMIT)
+        self._history_dropped = 0
+        self._task: Optional[asyncio.Task[None]] = None
+
+    def subscribe(self) -> SubscriberQueue:
+        queue = SubscriberQueue()
+        queue.dropped = self._history_dropped
+        for chunk in self._history:
+            queue.offer(chunk)
+        self._subscribers.add(queue)
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+        return queue
+
+    def unsubscribe(self, queue: SubscriberQueue) -> None:
+        self._subscribers.discard(queue)
+        if self._subscribers:
+            return
+        if _readers.get(self.job_id) is self:
+            del _readers[self.job_id]
+        if self._task is not None:
+            self._task.cancel()
+
+    def _broadcast(self, chunk: Optional[bytes]) -> None:
+        # Bounded queues drop their oldest frame for slow clients instead of
+        # growing; the end-of-stream ``None`` is always the newest item.
+        for queue in self._subscribers:
+            queue.offer(chunk)
+
+    async def _run(self) -> None:
+        job_id_context.set(self.job_id)
+        try:
+            async for is_heartbeat, chunk in _poll_job_events(self.job_id):
+                if not is_heartbeat:
+                    if len(self._history) == self._history.maxlen:
+                        self._history_dropped += 1
+                    self._history.append(chunk)
+                self._broadcast(chunk)
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:  # pragma: no cover - database issues
+            logger.warning("Job event reader stopped: %s", exc)
+        finally:
+            if _readers.get(self.job_id) is self:
+                del _readers[self.job_id]
+            self._broadcast(None)
+
+
+_readers: Dict[str, _JobEventReader] = {}
+
+
+async def _stream_job_events(job_id: str) -> AsyncGenerator[bytes, None]:
+    """Stream job events for the given job ID."""
+    reader = _readers.get(job_id)
+    if reader is None:
+        reader = _readers[job_id] = _JobEventReader(job_id)
+
+    queue = reader.subscribe()
+    try:
+        while True:
+            chunk = await queue.get()
+            if queue.dropped:
+                yield format_sse("lag", orjson.dumps({"dropped": queue.dropped}))
+                queue.dropped = 0
+            if chunk is None:
+                break
+            yield chunk
+    finally:
+        reader.unsubscribe(queue)
 
 
 @router.get("/{job_id}/stream")
-async def stream_job(job_id: str) -> EventSourceResponse:
+async def stream_job(job_id: str) -> StreamingResponse:
     """Stream job events via Server-Sent Events."""
-    session_factory = get_db_session()
-
-    async with session_factory() as session:
-        session = cast(AsyncSession, session)
-        job_exists = await session.execute(select(Job.id).where(Job.id == job_id))
-        if job_exists.scalar_one_or_none() is None:
-            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Job not found")
-
-    async def event_generator() -> AsyncGenerator[str, None]:
-        async for chunk in _stream_job_events(job_id, session_factory):
-            yield chunk
+    # A job with a live reader is known to exist; otherwise the owner lookup
+    # doubles as a cached existence check.
+    if job_id not in _readers and await get_job_service().get_job_owner(job_id) is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Job not found")
 
-    return EventSourceResponse(event_generator())
+    return sse_response(_stream_job_events(job_id))
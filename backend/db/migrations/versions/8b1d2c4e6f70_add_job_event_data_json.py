@@ -0,0 +1,34 @@
+"""Add pre-serialised payload column to job events."""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy import inspect
+
+# revision identifiers, used by Alembic.
+revision = "8b1d2c4e6f70"
+down_revision = "60f3f78cb7d9"
+branch_labels = None
+depends_on = None
+
+
+def _column_exists(inspector, table_name: str, column_name: str) -> bool:
+    try:
+        return any(col["name"] == column_name for col in inspector.get_columns(table_name))
+    except sa.exc.NoSuchTableError:
+        return False
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    inspector = inspect(bind)
+
+    if not _column_exists(inspector, "job_events", "data_json"):
+        op.add_column("job_events", sa.Column("data_json", sa.Text(), nullable=True))
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    inspector = inspect(bind)
+
+    if _column_exists(inspector, "job_events", "data_json"):
+        op.drop_column("job_events", "data_json")
@@ -0,0 +1,34 @@
+"""Add pre-serialised projection column to jobs."""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy import inspect
+
+# revision identifiers, used by Alembic.
+revision = "9c2e4a6b8d13"
+down_revision = "8b1d2c4e6f70"
+branch_labels = None
+depends_on = None
+
+
+def _column_exists(inspector, table_name: str, column_name: str) -> bool:
+    try:
+        return any(col["name"] == column_name for col in inspector.get_columns(table_name))
+    except sa.exc.NoSuchTableError:
+        return False
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    inspector = inspect(bind)
+
+    if not _column_exists(inspector, "jobs", "projection_json"):
+        op.add_column("jobs", sa.Column("projection_json", sa.Text(), nullable=True))
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    inspector = inspect(bind)
+
+    if _column_exists(inspector, "jobs", "projection_json"):
+        op.drop_column("jobs", "projection_json")
@@ -0,0 +1,60 @@
+"""Add composite indexes for per-user job and per-job ticket listings."""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy import inspect
+
+# revision identifiers, used by Alembic.
+revision = "a4d7e9c1f250"
+down_revision = "9c2e4a6b8d13"
+branch_labels = None
+depends_on = None
+
+
+def _index_exists(inspector, table_name: str, index_name: str) -> bool:
+    try:
+        return any(index["name"] == index_name for index in inspector.get_indexes(table_name))
+    except sa.exc.NoSuchTableError:
+        return False
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    inspector = inspect(bind)
+
+    # CONCURRENTLY cannot run inside the migration transaction; building the
+    # indexes outside it avoids locking writes on large tables.
+    with op.get_context().autocommit_block():
+        if not _index_exists(inspector, "jobs", "ix_jobs_user_id_created_at"):
+            op.create_index(
+                "ix_jobs_user_id_created_at",
+                "jobs",
+                ["user_id", sa.text("created_at DESC")],
+                postgresql_concurrently=True,
+            )
+        if not _index_exists(inspector, "tickets", "ix_tickets_job_id_created_at"):
+            op.create_index(
+                "ix_tickets_job_id_created_at",
+                "tickets",
+                ["job_id", "created_at"],
+                postgresql_concurrently=True,
+            )
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    inspector = inspect(bind)
+
+    with op.get_context().autocommit_block():
+        if _index_exists(inspector, "tickets", "ix_tickets_job_id_created_at"):
+            op.drop_index(
+                "ix_tickets_job_id_created_at",
+                table_name="tickets",
+                postgresql_concurrently=True,
+            )
+        if _index_exists(inspector, "jobs", "ix_jobs_user_id_created_at"):
+            op.drop_index(
+                "ix_jobs_user_id_created_at",
+                table_name="jobs",
+                postgresql_concurrently=True,
+            )
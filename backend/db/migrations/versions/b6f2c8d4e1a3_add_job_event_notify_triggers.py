@@ -0,0 +1,51 @@
+"""Notify listeners when a job gets a new event or changes status."""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "b6f2c8d4e1a3"
+down_revision = "a4d7e9c1f250"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Only the job id is sent: event payloads can exceed NOTIFY's 8000 byte
+    # limit, and listeners re-read the rows anyway.
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION notify_job_activity() RETURNS trigger AS $$
+        BEGIN
+            IF TG_TABLE_NAME = 'jobs' THEN
+                PERFORM pg_notify('job_events', NEW.id::text);
+            ELSE
+                PERFORM pg_notify('job_events', NEW.job_id::text);
+            END IF;
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute("DROP TRIGGER IF EXISTS job_events_notify ON job_events")
+    op.execute(
+        """
+        CREATE TRIGGER job_events_notify
+        AFTER INSERT ON job_events
+        FOR EACH ROW EXECUTE FUNCTION notify_job_activity()
+        """
+    )
+    op.execute("DROP TRIGGER IF EXISTS jobs_status_notify ON jobs")
+    op.execute(
+        """
+        CREATE TRIGGER jobs_status_notify
+        AFTER UPDATE OF status ON jobs
+        FOR EACH ROW WHEN (OLD.status IS DISTINCT FROM NEW.status)
+        EXECUTE FUNCTION notify_job_activity()
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS jobs_status_notify ON jobs")
+    op.execute("DROP TRIGGER IF EXISTS job_events_notify ON job_events")
+    op.execute("DROP FUNCTION IF EXISTS notify_job_activity()")
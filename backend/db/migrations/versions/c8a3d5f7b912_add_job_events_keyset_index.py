@@ -0,0 +1,60 @@
+"""Index job events on (job_id, created_at, id) for keyset resumption."""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy import inspect
+
+# revision identifiers, used by Alembic.
+revision = "c8a3d5f7b912"
+down_revision = "b6f2c8d4e1a3"
+branch_labels = None
+depends_on = None
+
+
+def _index_exists(inspector, table_name: str, index_name: str) -> bool:
+    try:
+        return any(index["name"] == index_name for index in inspector.get_indexes(table_name))
+    except sa.exc.NoSuchTableError:
+        return False
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    inspector = inspect(bind)
+
+    # The new index covers the old (job_id, created_at) prefix, so the old one
+    # is dropped once its replacement exists.
+    with op.get_context().autocommit_block():
+        if not _index_exists(inspector, "job_events", "ix_job_events_job_created_id"):
+            op.create_index(
+                "ix_job_events_job_created_id",
+                "job_events",
+                ["job_id", "created_at", "id"],
+                postgresql_concurrently=True,
+            )
+        if _index_exists(inspector, "job_events", "ix_job_events_job_id_created_at"):
+            op.drop_index(
+                "ix_job_events_job_id_created_at",
+                table_name="job_events",
+                postgresql_concurrently=True,
+            )
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    inspector = inspect(bind)
+
+    with op.get_context().autocommit_block():
+        if not _index_exists(inspector, "job_events", "ix_job_events_job_id_created_at"):
+            op.create_index(
+                "ix_job_events_job_id_created_at",
+                "job_events",
+                ["job_id", "created_at"],
+                postgresql_concurrently=True,
+            )
+        if _index_exists(inspector, "job_events", "ix_job_events_job_created_id"):
+            op.drop_index(
+                "ix_job_events_job_created_id",
+                table_name="job_events",
+                postgresql_concurrently=True,
+            )
@@ -0,0 +1,36 @@
+"""Replace the IVFFlat document embedding index with HNSW, built concurrently."""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "d2f4a6c8e013"
+down_revision = "c8a3d5f7b912"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # IVFFlat's fixed lists=100 was trained on whatever rows existed at
+    # migration time (usually none); HNSW needs no row-count tuning and keeps
+    # recall as the corpus grows. Built CONCURRENTLY so document writes are
+    # not blocked for the duration of the build.
+    with op.get_context().autocommit_block():
+        op.execute(
+            """
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_documents_content_embedding_hnsw
+            ON documents USING hnsw (content_embedding vector_l2_ops)
+            """
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_documents_content_embedding_ivfflat")
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute(
+            """
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_documents_content_embedding_ivfflat
+            ON documents USING ivfflat (content_embedding vector_l2_ops)
+            WITH (lists = 100)
+            """
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_documents_content_embedding_hnsw")
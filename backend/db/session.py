@@ -13,9 +13,15 @@ from core.config import settings
 
 DATABASE_URL = settings.database.DATABASE_URL
 
+# Sized from the same settings as the core engine so long-lived SSE streams
+# and the worker do not queue on SQLAlchemy's 5 + 10 connection default.
 engine = create_async_engine(
     DATABASE_URL,
-    pool_pre_ping=True,
+    pool_size=settings.database.DB_POOL_SIZE,
+    max_overflow=settings.database.DB_MAX_OVERFLOW,
+    pool_timeout=settings.database.DB_POOL_TIMEOUT,
+    pool_recycle=settings.database.DB_POOL_RECYCLE,
+    pool_pre_ping=settings.database.DB_POOL_PRE_PING,
     echo=settings.DEBUG,
 )
 
@@ -61,6 +61,7 @@ class DatabaseSettings(BaseModel):
     DB_POOL_TIMEOUT: int = 30
     DB_POOL_RECYCLE: int = 3600
     DB_POOL_PRE_PING: bool = True
+    DB_POOL_WARMUP: int = 5
 
     VECTOR_DIMENSION: int = 1536
 
@@ -289,6 +290,9 @@ class Settings(BaseSettings):
     METRICS_ENABLED: bool = Field(True, env="METRICS_ENABLED")
     METRICS_PORT: int = Field(8001, env="METRICS_PORT")
 
+    # Streaming
+    SSE_MAX_CONCURRENCY: int = Field(500, env="SSE_MAX_CONCURRENCY")
+
     # Security
     JWT_SECRET_KEY: str = Field(..., env="JWT_SECRET_KEY")
     JWT_ALGORITHM: str = Field("HS256", env="JWT_ALGORITHM")
@@ -327,6 +331,7 @@ class Settings(BaseSettings):
     DB_POOL_TIMEOUT: int = Field(30, env="DB_POOL_TIMEOUT")
     DB_POOL_RECYCLE: int = Field(3600, env="DB_POOL_RECYCLE")
     DB_POOL_PRE_PING: bool = Field(True, env="DB_POOL_PRE_PING")
+    DB_POOL_WARMUP: int = Field(5, env="DB_POOL_WARMUP")
     VECTOR_DIMENSION: int = Field(1536, env="VECTOR_DIMENSION")
 
     # Redis
@@ -507,6 +512,7 @@ class Settings(BaseSettings):
             DB_POOL_TIMEOUT=self.DB_POOL_TIMEOUT,
             DB_POOL_RECYCLE=self.DB_POOL_RECYCLE,
             DB_POOL_PRE_PING=self.DB_POOL_PRE_PING,
+            DB_POOL_WARMUP=self.DB_POOL_WARMUP,
             VECTOR_DIMENSION=self.VECTOR_DIMENSION,
         )
 
@@ -3,6 +3,7 @@ Database connection management for RCA Engine.
 Provides async database connection pool and session management.
 """
 
+import asyncio
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator, Callable
 
@@ -19,6 +20,9 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Built once; the same statement object is reused by every connectivity check.
+_PING = text("SELECT 1")
+
 
 class DatabaseManager:
     """Manages database connections and sessions."""
@@ -75,15 +79,40 @@ class DatabaseManager:
             
             # Test connection
             async with self._engine.begin() as conn:
-                await conn.execute(text("SELECT 1"))
+                await conn.execute(_PING)
             
             self._initialized = True
+            await self.warm_pool(settings.database.DB_POOL_WARMUP)
             logger.info("Database connection pool initialized successfully")
             
         except Exception as e:
             logger.error(f"Failed to initialize database: {e}")
             raise
     
+    async def warm_pool(self, connections: int) -> None:
+        """
+        Open pooled connections up front so the first requests skip connect latency.
+        
+        Args:
+            connections: Number of connections to establish, capped at the pool size.
+        """
+        count = min(connections, settings.database.DB_POOL_SIZE)
+        if not self._engine or count <= 0:
+            return
+        
+        opened = await asyncio.gather(
+            *(self._engine.connect() for _ in range(count)), return_exceptions=True
+        )
+        warmed = 0
+        for conn in opened:
+            if isinstance(conn, BaseException):
+                logger.warning(f"Failed to pre-open database connection: {conn}")
+                continue
+            # Closing returns the connection to the pool rather than dropping it.
+            await conn.close()
+            warmed += 1
+        logger.debug(f"Warmed {warmed} database connections")
+    
     async def create_tables(self):
         """Create all database tables."""
         if not self._initialized:
@@ -180,7 +209,7 @@ class DatabaseManager:
         
         try:
             async with self._engine.begin() as conn:
-                await conn.execute(text("SELECT 1"))
+                await conn.execute(_PING)
             return True
         except Exception as e:
             logger.error(f"Database health check failed: {e}")
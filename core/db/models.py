@@ -6,7 +6,9 @@ metadata, and watcher configuration as outlined in the PRD.
 
 from __future__ import annotations
 
+import json
 import uuid
+from datetime import datetime, timezone
 from typing import Any, Dict, Optional
 
 from sqlalchemy import (
@@ -20,10 +22,11 @@ from sqlalchemy import (
     JSON,
     String,
     Text,
+    event,
 )
 from sqlalchemy.dialects.postgresql import ARRAY, JSONB, UUID
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import relationship, validates, synonym
+from sqlalchemy.orm import object_session, relationship, validates, synonym
 from sqlalchemy.sql import func
 from pgvector.sqlalchemy import Vector
 
@@ -31,6 +34,10 @@ from core.config import settings
 
 Base = declarative_base()
 
+# Hoisted so status checks are a hash lookup without rebuilding the set.
+JOB_STATUSES = frozenset({"pending", "running", "completed", "failed", "cancelled"})
+TERMINAL_JOB_STATUSES = frozenset({"completed", "failed", "cancelled"})
+
 
 class Job(Base):
     """Top-level RCA job representation."""
@@ -70,6 +77,10 @@ class Job(Base):
     source = Column(JSON)
     error_message = Column(Text)
 
+    # Serialised ``to_dict()`` projection kept current by the flush listener
+    # below so list endpoints can return stored JSON without rebuilding it.
+    projection_json = Column(Text)
+
     events = relationship(
         "JobEvent", back_populates="job", cascade="all, delete-orphan"
     )
@@ -89,6 +100,7 @@ class Job(Base):
     __table_args__ = (
         Index("ix_jobs_status_created_at", "status", "created_at"),
         Index("ix_jobs_user_id_status", "user_id", "status"),
+        Index("ix_jobs_user_id_created_at", "user_id", created_at.desc()),
         CheckConstraint(
             "status IN ('pending', 'running', 'completed', 'failed', 'cancelled')",
             name="valid_job_status",
@@ -97,8 +109,7 @@ class Job(Base):
 
     @validates("status")
     def validate_status(self, _key, value: str) -> str:
-        allowed = {"pending", "running", "completed", "failed", "cancelled"}
-        if value not in allowed:
+        if value not in JOB_STATUSES:
             raise ValueError(f"Invalid status: {value}")
         return value
 
@@ -111,7 +122,7 @@ class Job(Base):
 
     @property
     def is_completed(self) -> bool:
-        return self.status in {"completed", "failed", "cancelled"}
+        return self.status in TERMINAL_JOB_STATUSES
 
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -141,6 +152,32 @@ class Job(Base):
         }
 
 
+@event.listens_for(Job, "before_insert")
+def _project_new_job(mapper, _connection, target: Job) -> None:
+    # Resolve client-side what the column defaults would fill in at INSERT
+    # time so the stored projection matches the persisted row.
+    for attr in mapper.column_attrs:
+        default = attr.columns[0].default
+        if default is None or getattr(target, attr.key) is not None:
+            continue
+        if default.is_scalar:
+            setattr(target, attr.key, default.arg)
+        elif default.is_callable:
+            setattr(target, attr.key, default.arg(None))
+    if target.created_at is None:
+        target.created_at = datetime.now(timezone.utc)
+    target.projection_json = json.dumps(target.to_dict(), default=str)
+
+
+@event.listens_for(Job, "before_update")
+def _project_updated_job(_mapper, _connection, target: Job) -> None:
+    session = object_session(target)
+    if session is not None and not session.is_modified(target, include_collections=False):
+        return
+    target.updated_at = datetime.now(timezone.utc)
+    target.projection_json = json.dumps(target.to_dict(), default=str)
+
+
 class JobEvent(Base):
     """Event stream for job lifecycle."""
 
@@ -152,6 +189,9 @@ class JobEvent(Base):
     )
     event_type = Column(String(50), nullable=False, index=True)
     data = Column(JSON)
+    # Serialised ``to_dict()`` projection written once by the producer so SSE
+    # readers can stream it verbatim instead of re-encoding per subscriber.
+    data_json = Column(Text)
     created_at = Column(
         DateTime(timezone=True), server_default=func.now(), nullable=False
     )
@@ -159,7 +199,7 @@ class JobEvent(Base):
     job = relationship("Job", back_populates="events")
 
     __table_args__ = (
-        Index("ix_job_events_job_id_created_at", "job_id", "created_at"),
+        Index("ix_job_events_job_created_id", "job_id", "created_at", "id"),
         Index("ix_job_events_event_type", "event_type"),
     )
 
@@ -278,9 +318,10 @@ class Document(Base):
         Index("ix_documents_job_id", "job_id"),
         Index("ix_documents_file_id", "file_id"),
         Index(
-            "ix_documents_content_embedding_ivfflat",
+            "ix_documents_content_embedding_hnsw",
             "content_embedding",
-            postgresql_using="ivfflat",
+            postgresql_using="hnsw",
+            postgresql_ops={"content_embedding": "vector_l2_ops"},
         ),
     )
 
@@ -378,6 +419,7 @@ class Ticket(Base):
 
     __table_args__ = (
         Index("ix_tickets_job_platform", "job_id", "platform"),
+        Index("ix_tickets_job_id_created_at", "job_id", "created_at"),
         Index("ix_tickets_ticket_id", "ticket_id"),
         CheckConstraint(
             "platform IN ('servicenow', 'jira')",
@@ -395,8 +437,9 @@ class Ticket(Base):
             "status": self.status,
             "profile_name": self.profile_name,
             "dry_run": self.dry_run,
-            "payload": self.payload,
-            "metadata": self.metadata,
+            # Coalesced here so API serialisers never need to patch ``None``.
+            "payload": self.payload or {},
+            "metadata": self.metadata or {},
             "created_at": self.created_at.isoformat() if self.created_at else None,
             "updated_at": self.updated_at.isoformat() if self.updated_at else None,
         }
@@ -9,10 +9,11 @@ channel and receive events without polling the database.
 from __future__ import annotations
 
 import asyncio
-import json
 from collections import defaultdict
 from typing import AsyncIterator, DefaultDict, Dict, List, Optional
 
+import orjson
+
 try:
     import redis.asyncio as redis  # type: ignore[attr-defined]
 except Exception:  # pragma: no cover - redis is optional at runtime
@@ -64,10 +65,19 @@ class JobEventBus:
     def _channel(job_id: str) -> str:
         return f"job-events:{job_id}"
 
+    @staticmethod
+    def encode(payload: Dict) -> str:
+        """Serialise a payload exactly once for every transport and subscriber."""
+        return orjson.dumps(
+            payload, default=str, option=orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z
+        ).decode("utf-8")
+
     async def publish(self, job_id: str, payload: Dict) -> None:
         """Publish an event for a job."""
-        serialised = json.dumps(payload, default=str)
+        await self.publish_encoded(job_id, self.encode(payload))
 
+    async def publish_encoded(self, job_id: str, serialised: str) -> None:
+        """Publish a payload that was already serialised with :meth:`encode`."""
         redis_client = await self._ensure_redis()
         if redis_client is not None:
             try:
@@ -79,6 +89,11 @@ class JobEventBus:
 
     async def subscribe(self, job_id: str) -> AsyncIterator[Dict]:
         """Subscribe to events for a specific job."""
+        async for data in self.subscribe_raw(job_id):
+            yield orjson.loads(data)
+
+    async def subscribe_raw(self, job_id: str) -> AsyncIterator[str]:
+        """Subscribe to the serialised JSON payloads for a specific job."""
         redis_client = await self._ensure_redis()
         if redis_client is not None:
             pubsub = redis_client.pubsub(ignore_subscribe_messages=True)
@@ -90,7 +105,7 @@ class JobEventBus:
                     data = message.get("data")
                     if not data:
                         continue
-                    yield json.loads(data)
+                    yield data
             finally:
                 try:
                     await pubsub.unsubscribe(self._channel(job_id))
@@ -102,8 +117,7 @@ class JobEventBus:
         await self._register_local(job_id, queue)
         try:
             while True:
-                data = await queue.get()
-                yield json.loads(data)
+                yield await queue.get()
         finally:
             await self._unregister_local(job_id, queue)
 
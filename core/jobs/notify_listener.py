@@ -0,0 +1,123 @@
+"""
+PostgreSQL ``LISTEN`` wake-ups for job event pollers.
+
+Triggers on ``job_events`` and ``jobs`` (see migration ``b6f2c8d4e1a3``)
+``NOTIFY`` the job id whenever a job gets a new event or changes status. A
+single dedicated asyncpg connection per process listens on that channel and
+wakes the pollers watching the job, so idle streams stop querying the
+database. Notifications only carry the job id: pollers still read the rows
+themselves, which keeps payloads under Postgres' 8000 byte ``NOTIFY`` limit.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Dict, Optional, Set
+
+try:
+    import asyncpg
+except Exception:  # pragma: no cover - asyncpg is optional at runtime
+    asyncpg = None  # type: ignore[assignment]
+
+from core.config import settings
+from core.logging import get_logger
+
+logger = get_logger(__name__)
+
+JOB_NOTIFY_CHANNEL = "job_events"
+
+# How long to wait before retrying after the listener connection failed.
+RECONNECT_DELAY_SECONDS = 30.0
+
+
+class JobNotifyListener:
+    """Wake per-job watchers when Postgres reports activity for their job."""
+
+    def __init__(self, channel: str = JOB_NOTIFY_CHANNEL) -> None:
+        self._channel = channel
+        self._connection: Optional["asyncpg.Connection"] = None
+        self._watchers: Dict[str, Set[asyncio.Event]] = {}
+        self._lock = asyncio.Lock()
+        self._retry_at = 0.0
+
+    @property
+    def active(self) -> bool:
+        """Whether notifications are currently being received."""
+        return self._connection is not None and not self._connection.is_closed()
+
+    async def watch(self, job_id: str) -> Optional[asyncio.Event]:
+        """Return an event set on every notification for ``job_id``.
+
+        ``None`` means notifications are unavailable and the caller should
+        keep polling on its own schedule.
+        """
+        if not await self._ensure_connection():
+            return None
+        event = asyncio.Event()
+        self._watchers.setdefault(job_id, set()).add(event)
+        return event
+
+    def unwatch(self, job_id: str, event: asyncio.Event) -> None:
+        """Stop delivering notifications for ``job_id`` to ``event``."""
+        watchers = self._watchers.get(job_id)
+        if watchers is None:
+            return
+        watchers.discard(event)
+        if not watchers:
+            del self._watchers[job_id]
+
+    async def close(self) -> None:
+        """Close the listener connection and wake every watcher."""
+        connection, self._connection = self._connection, None
+        if connection is not None and not connection.is_closed():
+            await connection.close()
+        self._wake_all()
+
+    async def _ensure_connection(self) -> bool:
+        if self.active:
+            return True
+        if asyncpg is None:
+            return False
+
+        async with self._lock:
+            if self.active:
+                return True
+            loop = asyncio.get_running_loop()
+            if loop.time() < self._retry_at:
+                return False
+            try:
+                # A dedicated connection: LISTEN state must not leak back into
+                # the SQLAlchemy pool.
+                dsn = settings.database.DATABASE_URL.replace(
+                    "postgresql+asyncpg://", "postgresql://", 1
+                )
+                connection = await asyncpg.connect(dsn)
+                await connection.add_listener(self._channel, self._on_notify)
+                connection.add_termination_listener(self._on_terminated)
+            except Exception as exc:  # pragma: no cover - network failure
+                logger.warning("Job notification listener unavailable: %s", exc)
+                self._retry_at = loop.time() + RECONNECT_DELAY_SECONDS
+                return False
+            self._connection = connection
+            return True
+
+    def _on_notify(self, _connection, _pid, _channel, payload: str) -> None:
+        for event in self._watchers.get(payload, ()):
+            event.set()
+
+    def _on_terminated(self, _connection) -> None:  # pragma: no cover - network failure
+        logger.warning("Job notification listener connection lost")
+        self._connection = None
+        # Watchers may have missed notifications; make them poll once now.
+        self._wake_all()
+
+    def _wake_all(self) -> None:
+        for watchers in self._watchers.values():
+            for event in watchers:
+                event.set()
+
+
+# Global listener instance
+job_notify_listener = JobNotifyListener()
+
+__all__ = ["JOB_NOTIFY_CHANNEL", "JobNotifyListener", "job_notify_listener"]
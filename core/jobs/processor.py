@@ -28,6 +28,7 @@ from core.privacy import PiiRedactor, RedactionResult
 
 logger = get_logger(__name__)
 
+_KEYWORD_PATTERN = re.compile(r"[a-z]{4,}")
 
 
 @dataclass
@@ -749,9 +750,9 @@ class JobProcessor:
         critical_count = sum("critical" in line for line in lowered)
         info_count = sum("info" in line for line in lowered)
 
-        keywords: Counter[str] = Counter()
-        for line in lowered:
-            keywords.update(re.findall(r"[a-z]{4,}", line))
+        # Keywords never span lines, so one scan over the joined text yields the
+        # same words, in the same order, as scanning each line separately.
+        keywords: Counter[str] = Counter(_KEYWORD_PATTERN.findall("\n".join(lowered)))
 
         sample_head = list(lines[:5])
         sample_tail = list(lines[-5:]) if len(lines) > 5 else []
@@ -0,0 +1,199 @@
+"""
+Process-wide fan-out of job events to local SSE subscribers.
+
+Every streaming client for a job shares a single ``job_event_bus``
+subscription; a dispatcher task per job copies each payload into the
+per-client queues and is torn down once the last client disconnects.
+
+The heartbeat ticker also looks up the status of every watched job once per
+interval and pushes a ``status`` item when it is terminal, so streams end even
+when the worker's events never reach this process' bus.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple
+
+import orjson
+
+from core.db.models import TERMINAL_JOB_STATUSES
+from core.jobs.event_bus import JobEventBus, job_event_bus
+from core.logging import get_logger, job_id_context
+
+logger = get_logger(__name__)
+
+# ``(kind, payload, data)`` where ``data`` is the payload's wire encoding,
+# shared by every subscriber instead of re-serialised per client.
+HubItem = Tuple[str, Dict[str, Any], str]
+
+# Resolves a job id to its current status, or ``None`` when it is unknown.
+StatusLookup = Callable[[str], Awaitable[Optional[str]]]
+
+HEARTBEAT_INTERVAL_SECONDS = 15.0
+SUBSCRIBER_QUEUE_SIZE = 256
+
+
+class SubscriberQueue(asyncio.Queue):
+    """Bounded client queue that drops its oldest item instead of growing."""
+
+    def __init__(self, maxsize: int = SUBSCRIBER_QUEUE_SIZE) -> None:
+        super().__init__(maxsize=maxsize)
+        self.dropped = 0
+
+    def offer(self, item: HubItem) -> None:
+        """Enqueue ``item``, evicting the oldest pending event when full."""
+        if self.full():
+            self.get_nowait()
+            self.dropped += 1
+        self.put_nowait(item)
+
+
+class PubSubHub:
+    """Share one event bus subscription per job across local subscribers."""
+
+    def __init__(
+        self,
+        bus: JobEventBus,
+        heartbeat_interval: float = HEARTBEAT_INTERVAL_SECONDS,
+        status_lookup: Optional[StatusLookup] = None,
+    ) -> None:
+        self._bus = bus
+        self._status_lookup = status_lookup
+        self._status_check: Optional[asyncio.Task[None]] = None
+        self._subscribers: Dict[str, Set[SubscriberQueue]] = {}
+        self._dispatchers: Dict[str, asyncio.Task[None]] = {}
+        self._heartbeat_interval = heartbeat_interval
+        self._heartbeat = asyncio.Event()
+        self._ticker: Optional[asyncio.TimerHandle] = None
+        self._next_tick = 0.0
+
+    def heartbeat(self) -> asyncio.Event:
+        """Process-wide event pulsed every heartbeat interval for all streams."""
+        if self._ticker is None:
+            loop = asyncio.get_running_loop()
+            self._next_tick = loop.time() + self._heartbeat_interval
+            self._ticker = loop.call_at(self._next_tick, self._tick)
+        return self._heartbeat
+
+    def subscribe(self, job_id: str) -> SubscriberQueue:
+        """Register a client queue for ``job_id`` and start its dispatcher if needed."""
+        queue = SubscriberQueue()
+        self._subscribers.setdefault(job_id, set()).add(queue)
+        if job_id not in self._dispatchers:
+            self._dispatchers[job_id] = asyncio.create_task(self._dispatch(job_id))
+        return queue
+
+    def unsubscribe(self, job_id: str, queue: SubscriberQueue) -> None:
+        """Remove a client queue, cancelling the dispatcher after the last one."""
+        subscribers = self._subscribers.get(job_id)
+        if subscribers is None:
+            return
+
+        subscribers.discard(queue)
+        if subscribers:
+            return
+
+        del self._subscribers[job_id]
+        dispatcher = self._dispatchers.pop(job_id, None)
+        if dispatcher is not None:
+            dispatcher.cancel()
+
+    async def close(self) -> None:
+        """Cancel the ticker and all dispatchers, closing open subscriber queues."""
+        if self._ticker is not None:
+            self._ticker.cancel()
+            self._ticker = None
+        if self._status_check is not None:
+            self._status_check.cancel()
+            self._status_check = None
+
+        dispatchers = list(self._dispatchers.values())
+        for dispatcher in dispatchers:
+            dispatcher.cancel()
+        for dispatcher in dispatchers:
+            with contextlib.suppress(asyncio.CancelledError):
+                await dispatcher
+
+    def _tick(self) -> None:
+        # Waiters already parked on ``wait()`` are woken by ``set``; clearing
+        # straight away re-arms the event for the next interval.
+        self._heartbeat.set()
+        self._heartbeat.clear()
+
+        if not self._subscribers:
+            # Go idle until the next stream asks for heartbeats.
+            self._ticker = None
+            return
+
+        # One lookup per watched job per interval, however many clients it has.
+        # A slow database must not stack checks on top of each other.
+        if self._status_lookup is not None and (
+            self._status_check is None or self._status_check.done()
+        ):
+            self._status_check = asyncio.create_task(
+                self._check_statuses(self._status_lookup, list(self._subscribers))
+            )
+
+        # Schedule from the previous deadline rather than "now" so ticks do
+        # not drift by the callback latency.
+        self._next_tick += self._heartbeat_interval
+        self._ticker = asyncio.get_running_loop().call_at(self._next_tick, self._tick)
+
+    async def _check_statuses(self, lookup: StatusLookup, job_ids: List[str]) -> None:
+        for job_id in job_ids:
+            if job_id not in self._subscribers:
+                continue
+            try:
+                job_status = await lookup(job_id)
+            except Exception as exc:  # pragma: no cover - database issues
+                logger.warning("Job status check failed: %s", exc)
+                return
+            if job_status not in TERMINAL_JOB_STATUSES:
+                continue
+            item: HubItem = ("status", {"status": job_status}, "")
+            for queue in self._subscribers.get(job_id, ()):
+                queue.offer(item)
+
+    async def _dispatch(self, job_id: str) -> None:
+        job_id_context.set(job_id)
+        try:
+            async for data in self._bus.subscribe_raw(job_id):
+                item: HubItem = ("event", orjson.loads(data), data)
+                for queue in self._subscribers.get(job_id, ()):
+                    queue.offer(item)
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:  # pragma: no cover - transport issues
+            logger.warning("Event subscription lost: %s", exc)
+        finally:
+            # Only the registered dispatcher owns the subscriber set; a
+            # cancelled one has already been detached by ``unsubscribe``.
+            if self._dispatchers.get(job_id) is asyncio.current_task():
+                del self._dispatchers[job_id]
+                for queue in self._subscribers.pop(job_id, ()):
+                    # ``closed`` is always the final item, so eviction can
+                    # never discard it.
+                    queue.offer(("closed", {}, ""))
+
+
+async def _lookup_job_status(job_id: str) -> Optional[str]:
+    # Imported lazily: the service module pulls in the database layer.
+    from core.jobs.service import get_job_service
+
+    return await get_job_service().get_job_status(job_id)
+
+
+# Global hub instance
+job_event_hub = PubSubHub(job_event_bus, status_lookup=_lookup_job_status)
+
+__all__ = [
+    "HEARTBEAT_INTERVAL_SECONDS",
+    "HubItem",
+    "PubSubHub",
+    "SUBSCRIBER_QUEUE_SIZE",
+    "StatusLookup",
+    "SubscriberQueue",
+    "job_event_hub",
+]
@@ -4,13 +4,17 @@ Business logic for job processing, state management, and event tracking.
 """
 
 import asyncio
+import json
 import logging
+import time
+import uuid
+from collections import OrderedDict
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Literal, Optional, Tuple, Union
 
-from sqlalchemy import and_, func, or_, select, update
+from sqlalchemy import and_, func, or_, select, tuple_, update
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import aliased, selectinload
 
 from core.config import settings
 from core.db.database import get_db_session
@@ -26,6 +30,11 @@ from core.jobs.event_bus import job_event_bus
 
 logger = logging.getLogger(__name__)
 
+# Existence/ownership lookups are cached briefly: a job's owner never changes,
+# so the only staleness is a job deleted within the TTL.
+JOB_OWNER_CACHE_TTL_SECONDS = 30.0
+JOB_OWNER_CACHE_SIZE = 4096
+
 
 class JobService:
 
@@ -34,6 +43,7 @@ class JobService:
     def __init__(self):
         self._session_factory = get_db_session()
         self._event_bus = job_event_bus
+        self._owner_cache: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
 
     @staticmethod
     def _register_session_event(
@@ -47,7 +57,7 @@ class JobService:
         """Publish any events queued on the session."""
         pending = session.info.pop("_job_pending_events", [])
         for job_id, event in pending:
-            await self._event_bus.publish(job_id, event.to_dict())
+            await self._event_bus.publish_encoded(job_id, event.data_json)
 
     async def publish_session_events(self, session: AsyncSession) -> None:
         """Public wrapper used by external callers to flush queued events."""
@@ -158,7 +168,7 @@ class JobService:
             logger.info(f"Created job: {job.id} for user: {user_id}")
             return job
     
-    async def get_job(self, job_id: str) -> Optional[Job]:
+    async def get_job(self, job_id: Union[str, uuid.UUID]) -> Optional[Job]:
         """Get job by ID."""
         async with self._session_factory() as session:
             result = await session.execute(
@@ -173,6 +183,40 @@ class JobService:
             )
             return result.scalar_one_or_none()
     
+    async def get_job_owner(self, job_id: Union[str, uuid.UUID]) -> Optional[str]:
+        """Return the owning user id of a job, or ``None`` when it does not exist.
+
+        Cheaper than :meth:`get_job` for existence and permission checks: only
+        the owner column is read, and found jobs are cached for
+        ``JOB_OWNER_CACHE_TTL_SECONDS``.
+        """
+        key = str(job_id)
+        now = time.monotonic()
+        cached = self._owner_cache.get(key)
+        if cached is not None and cached[0] > now:
+            self._owner_cache.move_to_end(key)
+            return cached[1]
+
+        async with self._session_factory() as session:
+            result = await session.execute(select(Job.user_id).where(Job.id == job_id))
+            owner = result.scalar_one_or_none()
+
+        if owner is None:
+            self._owner_cache.pop(key, None)
+            return None
+
+        self._owner_cache[key] = (now + JOB_OWNER_CACHE_TTL_SECONDS, owner)
+        self._owner_cache.move_to_end(key)
+        if len(self._owner_cache) > JOB_OWNER_CACHE_SIZE:
+            self._owner_cache.popitem(last=False)
+        return owner
+
+    async def get_job_status(self, job_id: Union[str, uuid.UUID]) -> Optional[str]:
+        """Return only a job's status, or ``None`` when it does not exist."""
+        async with self._session_factory() as session:
+            result = await session.execute(select(Job.status).where(Job.id == job_id))
+            return result.scalar_one_or_none()
+
     async def get_user_jobs(
         self,
         user_id: Optional[str] = None,
@@ -195,9 +239,62 @@ class JobService:
 
             result = await session.execute(query)
             return result.scalars().all()
-    
-    async def get_next_pending_job(self) -> Optional[Job]:
-        """Get next pending job for processing (with proper locking)."""
+
+    async def get_user_job_projections(
+        self,
+        user_id: Optional[str] = None,
+        status: Optional[str] = None,
+        limit: int = 100,
+        offset: int = 0,
+        before: Optional[Tuple[datetime, uuid.UUID]] = None,
+    ) -> Tuple[List[str], Optional[Tuple[datetime, uuid.UUID]]]:
+        """Return stored JSON projections for ``get_user_jobs`` without loading rows.
+
+        ``before`` is the ``(created_at, id)`` key of the last job on the
+        previous page; when given it replaces ``offset`` so deep pages seek
+        straight into the index instead of skipping rows. The key of the last
+        returned job is handed back for the next page.
+        """
+        async with self._session_factory() as session:
+            query = select(Job.id, Job.created_at, Job.projection_json)
+
+            if user_id:
+                query = query.where(Job.user_id == user_id)
+
+            if status:
+                query = query.where(Job.status == status)
+
+            if before is not None:
+                query = query.where(tuple_(Job.created_at, Job.id) < tuple_(*before))
+
+            # ``id`` breaks ties so keyset pages never skip or repeat jobs.
+            query = query.order_by(Job.created_at.desc(), Job.id.desc()).limit(limit)
+            if before is None:
+                query = query.offset(offset)
+
+            rows = (await session.execute(query)).all()
+
+            # Rows written before the projection column existed are rendered
+            # from the ORM instance instead.
+            missing = [job_id for job_id, _, projection in rows if projection is None]
+            fallback: Dict[Any, str] = {}
+            if missing:
+                result = await session.execute(select(Job).where(Job.id.in_(missing)))
+                fallback = {
+                    job.id: json.dumps(job.to_dict(), default=str)
+                    for job in result.scalars()
+                }
+
+            projections = [projection or fallback[job_id] for job_id, _, projection in rows]
+            last_key = (rows[-1].created_at, rows[-1].id) if rows else None
+            return projections, last_key
+
+    async def get_next_pending_job(self, worker_id: Optional[str] = None) -> Optional[Job]:
+        """Get next pending job for processing (with proper locking).
+
+        When ``worker_id`` is given the ``worker-assigned`` event is written in
+        the claiming transaction instead of a separate round trip.
+        """
         async with self._session_factory() as session:
             job: Optional[Job] = None
 
@@ -226,9 +323,16 @@ class JobService:
                     await self.create_job_event(
                         job.id,
                         "started",
-                        {"worker_id": "worker_instance"},
+                        {"worker_id": worker_id or "worker_instance"},
                         session=session,
                     )
+                    if worker_id:
+                        await self.create_job_event(
+                            job.id,
+                            "worker-assigned",
+                            {"worker_id": worker_id},
+                            session=session,
+                        )
 
             if job:
                 await self._publish_session_events(session)
@@ -377,14 +481,19 @@ class JobService:
         """
 
         async def _persist(target_session: AsyncSession) -> JobEvent:
+            # Assign identity and timestamp client-side so the serialised
+            # projection can be written in the same INSERT.
             event = JobEvent(
+                id=uuid.uuid4(),
                 job_id=job_id,
                 event_type=event_type,
                 data=data or {},
+                created_at=datetime.now(timezone.utc),
             )
+            # Encoded once here; SSE replay and live publication reuse it.
+            event.data_json = self._event_bus.encode(event.to_dict())
             target_session.add(event)
             await target_session.flush()
-            await target_session.refresh(event)
             logger.debug("Created event %s for job %s", event_type, job_id)
             return event
 
@@ -396,24 +505,42 @@ class JobService:
         async with self._session_factory() as session_ctx:
             async with session_ctx.begin():
                 event = await _persist(session_ctx)
-            await self._event_bus.publish(job_id, event.to_dict())
+            await self._event_bus.publish_encoded(job_id, event.data_json)
             return event
     
     async def get_job_events(
         self, 
         job_id: str, 
         limit: int = 100,
-        event_type: Optional[str] = None
+        event_type: Optional[str] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        order: Literal["asc", "desc"] = "desc",
     ) -> List[JobEvent]:
-        """Get events for a job."""
+        """Get the most recent events for a job within the optional ``(since, until]`` window.
+
+        ``order`` controls how the selected window is returned: newest first by
+        default, or chronologically for replay.
+        """
         async with self._session_factory() as session:
             query = select(JobEvent).where(JobEvent.job_id == job_id)
             
             if event_type:
                 query = query.where(JobEvent.event_type == event_type)
+
+            if since:
+                query = query.where(JobEvent.created_at > since)
+
+            if until:
+                query = query.where(JobEvent.created_at <= until)
             
             query = query.order_by(JobEvent.created_at.desc())
             query = query.limit(limit)
+
+            if order == "asc":
+                recent = query.subquery()
+                recent_event = aliased(JobEvent, recent)
+                query = select(recent_event).order_by(recent.c.created_at.asc())
             
             result = await session.execute(query)
             return result.scalars().all()
@@ -435,6 +562,44 @@ class JobService:
             result = await session.execute(query)
             return result.scalars().all()
 
+    async def get_job_status_and_new_events(
+        self,
+        job_id: str,
+        since: Optional[datetime] = None,
+        limit: Optional[int] = 250,
+        after_id: Optional[uuid.UUID] = None,
+    ) -> Tuple[Optional[str], List[JobEvent]]:
+        """Fetch a job's status and its events after ``since`` in one round-trip.
+
+        Passing the last seen event's ``created_at`` and ``after_id`` resumes
+        on the ``(created_at, id)`` key, so events sharing a timestamp are
+        neither skipped nor replayed. Returns ``(None, [])`` when the job does
+        not exist.
+        """
+        join_on = JobEvent.job_id == Job.id
+        if since and after_id:
+            join_on = and_(
+                join_on, tuple_(JobEvent.created_at, JobEvent.id) > tuple_(since, after_id)
+            )
+        elif since:
+            join_on = and_(join_on, JobEvent.created_at > since)
+
+        async with self._session_factory() as session:
+            query = (
+                select(Job.status, JobEvent)
+                .select_from(Job)
+                .outerjoin(JobEvent, join_on)
+                .where(Job.id == job_id)
+                .order_by(JobEvent.created_at.asc(), JobEvent.id.asc())
+            )
+            if limit:
+                query = query.limit(limit)
+
+            rows = (await session.execute(query)).all()
+            if not rows:
+                return None, []
+            return rows[0][0], [event for _, event in rows if event is not None]
+
     async def get_conversation(
         self,
         job_id: str,
@@ -453,42 +618,61 @@ class JobService:
             return result.scalars().all()
     
     async def get_job_statistics(self, user_id: Optional[str] = None) -> Dict[str, Any]:
-        """Get job statistics."""
+        """Get job statistics.
+
+        Aggregated in a single ``GROUP BY status, job_type`` query so only one
+        row per status/type pair leaves the database.
+        """
+        duration = func.extract("epoch", Job.completed_at - Job.started_at)
+        timed = and_(
+            Job.status == "completed",
+            Job.started_at.isnot(None),
+            Job.completed_at.isnot(None),
+            duration != 0,
+        )
+        query = select(
+            Job.status,
+            Job.job_type,
+            func.count().label("count"),
+            func.sum(duration).filter(timed).label("duration_total"),
+            func.count().filter(timed).label("duration_count"),
+        ).group_by(Job.status, Job.job_type)
+
+        if user_id:
+            query = query.where(Job.user_id == user_id)
+
         async with self._session_factory() as session:
-            query = select(Job)
-            
-            if user_id:
-                query = query.where(Job.user_id == user_id)
-            
-            result = await session.execute(query)
-            jobs = result.scalars().all()
-            
-            stats = {
-                "total": len(jobs),
-                "by_status": {},
-                "by_type": {},
-                "avg_duration": 0,
-                "success_rate": 0
-            }
-            
-            completed_jobs = [j for j in jobs if j.status == "completed"]
-            failed_jobs = [j for j in jobs if j.status == "failed"]
-            
-            # Status breakdown
-            for job in jobs:
-                stats["by_status"][job.status] = stats["by_status"].get(job.status, 0) + 1
-                stats["by_type"][job.job_type] = stats["by_type"].get(job.job_type, 0) + 1
-            
-            # Success rate
-            if completed_jobs or failed_jobs:
-                stats["success_rate"] = len(completed_jobs) / (len(completed_jobs) + len(failed_jobs)) * 100
-            
-            # Average duration
-            durations = [j.duration_seconds for j in completed_jobs if j.duration_seconds]
-            if durations:
-                stats["avg_duration"] = sum(durations) / len(durations)
-            
-            return stats
+            rows = (await session.execute(query)).all()
+
+        stats = {
+            "total": 0,
+            "by_status": {},
+            "by_type": {},
+            "avg_duration": 0,
+            "success_rate": 0
+        }
+        duration_total = 0.0
+        duration_count = 0
+
+        for row in rows:
+            stats["total"] += row.count
+            stats["by_status"][row.status] = stats["by_status"].get(row.status, 0) + row.count
+            stats["by_type"][row.job_type] = stats["by_type"].get(row.job_type, 0) + row.count
+            if row.duration_count:
+                duration_total += float(row.duration_total)
+                duration_count += row.duration_count
+
+        # Success rate
+        completed = stats["by_status"].get("completed", 0)
+        failed = stats["by_status"].get("failed", 0)
+        if completed or failed:
+            stats["success_rate"] = completed / (completed + failed) * 100
+
+        # Average duration
+        if duration_count:
+            stats["avg_duration"] = duration_total / duration_count
+
+        return stats
     
     async def cleanup_old_jobs(self, days: int = 30):
         """Clean up old completed jobs."""
@@ -507,9 +691,21 @@ class JobService:
             deleted_count = len(old_jobs)
             
             for job in old_jobs:
+                self._owner_cache.pop(str(job.id), None)
                 await session.delete(job)
             
             await session.commit()
             
             logger.info(f"Cleaned up {deleted_count} old jobs older than {days} days")
             return deleted_count
+
+
+_job_service: Optional[JobService] = None
+
+
+def get_job_service() -> JobService:
+    """Return the process-wide ``JobService`` instance, creating it on first use."""
+    global _job_service
+    if _job_service is None:
+        _job_service = JobService()
+    return _job_service
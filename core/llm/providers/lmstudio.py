@@ -3,6 +3,7 @@ LM Studio Provider
 Provides integration with LM Studio for local LLM inference.
 """
 
+import json
 import logging
 import time
 from typing import List, Optional, AsyncGenerator, Dict, Any
@@ -237,7 +238,6 @@ class LMStudioProvider(BaseLLMProvider):
                         line = line[6:]  # Remove "data: " prefix
                         
                         try:
-                            import json
                             data = json.loads(line)
                             
                             if "choices" in data and len(data["choices"]) > 0:
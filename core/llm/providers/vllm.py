@@ -3,6 +3,7 @@ vLLM Provider
 Provides integration with vLLM for high-throughput LLM inference.
 """
 
+import json
 import logging
 import time
 from typing import List, Optional, AsyncGenerator, Dict, Any
@@ -239,7 +240,6 @@ class VLLMProvider(BaseLLMProvider):
                         line = line[6:]  # Remove "data: " prefix
                         
                         try:
-                            import json
                             data = json.loads(line)
                             
                             if "choices" in data and len(data["choices"]) > 0:
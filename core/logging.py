@@ -6,11 +6,16 @@ Provides comprehensive logging with JSON formatting and context.
 import logging
 import sys
 import json
+from contextvars import ContextVar
 from datetime import datetime, timezone
 from typing import Any, Dict, Optional
 from pythonjsonlogger import jsonlogger
 from core.config import settings
 
+# Job bound to the current task (e.g. an SSE stream or event dispatcher) so
+# log lines carry it without formatting it into every message.
+job_id_context: ContextVar[Optional[str]] = ContextVar("job_id", default=None)
+
 
 class CustomJsonFormatter(jsonlogger.JsonFormatter):
     """Custom JSON formatter for structured logging."""
@@ -79,6 +84,26 @@ class ContextFilter(logging.Filter):
         return True
 
 
+class JobContextFilter(logging.Filter):
+    """Filter that stamps records with the job id from ``job_id_context``."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        """
+        Add the current job id to the log record unless one was passed explicitly.
+
+        Args:
+            record: Log record
+
+        Returns:
+            bool: Always True to allow the record
+        """
+        if not hasattr(record, 'job_id'):
+            job_id = job_id_context.get()
+            if job_id is not None:
+                record.job_id = job_id
+        return True
+
+
 def setup_logging(
     log_level: Optional[str] = None,
     log_format: Optional[str] = None
@@ -116,6 +141,7 @@ def setup_logging(
         )
     
     console_handler.setFormatter(formatter)
+    console_handler.addFilter(JobContextFilter())
     root_logger.addHandler(console_handler)
     
     # Set log levels for third-party libraries
@@ -277,6 +303,8 @@ __all__ = [
     'LoggerAdapter',
     'CustomJsonFormatter',
     'ContextFilter',
+    'JobContextFilter',
+    'job_id_context',
     'log_api_request',
     'log_job_event',
     'log_error',
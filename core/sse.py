@@ -0,0 +1,50 @@
+"""
+Server-Sent Event framing shared by every streaming endpoint.
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import AsyncIterator, Optional, Protocol, Union
+
+from fastapi.responses import StreamingResponse
+from starlette.background import BackgroundTask
+
+SSE_HEADERS = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+
+
+class ReleasableSlot(Protocol):
+    """Anything holding a resource that must be freed when a stream ends."""
+
+    async def release(self) -> None: ...
+
+
+@lru_cache(maxsize=128)
+def _frame_prefix(event: str) -> bytes:
+    # Event names come from a small fixed vocabulary, so their encoded frame
+    # headers are built once and reused.
+    return b"event: " + event.encode("utf-8") + b"\ndata: "
+
+
+def format_sse(event: str, data: Union[str, bytes]) -> bytes:
+    """Encode a single Server-Sent Event frame."""
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    return _frame_prefix(event) + data + b"\n\n"
+
+
+def sse_response(
+    stream: AsyncIterator[bytes], slot: Optional[ReleasableSlot] = None
+) -> StreamingResponse:
+    """Wrap a generator of pre-encoded frames in an ``text/event-stream`` response.
+
+    When ``slot`` is given it is released once the response finishes, which
+    also covers clients that disconnect before the stream starts iterating.
+    """
+    background = BackgroundTask(slot.release) if slot is not None else None
+    return StreamingResponse(
+        stream, media_type="text/event-stream", headers=SSE_HEADERS, background=background
+    )
+
+
+__all__ = ["ReleasableSlot", "SSE_HEADERS", "format_sse", "sse_response"]
@@ -1,6 +1,12 @@
 """Ticket service exports."""
 
-from .service import TicketService
+from .service import JobNotFoundError, TicketDispatchResult, TicketService
 from .settings import TicketSettingsService, TicketToggleState
 
-__all__ = ["TicketService", "TicketSettingsService", "TicketToggleState"]
+__all__ = [
+    "JobNotFoundError",
+    "TicketDispatchResult",
+    "TicketService",
+    "TicketSettingsService",
+    "TicketToggleState",
+]
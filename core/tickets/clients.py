@@ -4,6 +4,7 @@ HTTP client adapters for ServiceNow and Jira ITSM platforms.
 
 from __future__ import annotations
 
+import asyncio
 import base64
 import time
 from dataclasses import dataclass
@@ -12,6 +13,13 @@ from typing import Any, Dict, Optional
 import httpx
 
 
+# Parallel ticket creation and status refresh batches share these pools; the
+# keep-alive expiry stays below typical ITSM load balancer idle timeouts.
+ITSM_CONNECTION_LIMITS = httpx.Limits(
+    max_connections=32, max_keepalive_connections=16, keepalive_expiry=30.0
+)
+
+
 class TicketClientError(RuntimeError):
     """Raised when a remote ITSM integration fails."""
 
@@ -68,7 +76,33 @@ class TicketCreationResult:
     metadata: Dict[str, Any]
 
 
-class ServiceNowClient:
+class _PooledHTTPClient:
+    """Keeps one keep-alive ``httpx.AsyncClient`` per ITSM adapter.
+
+    Ticket creation and status refreshes hit the same host repeatedly, so the
+    TCP/TLS connection is reused instead of being re-established per call.
+    """
+
+    _config: Any
+    _client: Optional[httpx.AsyncClient] = None
+
+    def _http(self) -> httpx.AsyncClient:
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                timeout=self._config.timeout,
+                verify=self._config.verify_ssl,
+                limits=ITSM_CONNECTION_LIMITS,
+            )
+        return self._client
+
+    async def close(self) -> None:
+        """Close pooled connections to the ITSM platform."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+
+class ServiceNowClient(_PooledHTTPClient):
     """Thin wrapper around the ServiceNow incident REST API."""
 
     _STATE_MAP = {
@@ -85,19 +119,35 @@ class ServiceNowClient:
         self._config = config
         self._token: Optional[str] = None
         self._token_expiry: Optional[float] = None
+        self._token_lock = asyncio.Lock()
 
     @property
     def enabled(self) -> bool:
         return bool(self._config.base_url)
 
-    async def _get_oauth_token(self) -> str:
+    def _cached_token(self) -> Optional[str]:
         if (
             self._token
             and self._token_expiry is not None
             and self._token_expiry - time.monotonic() > 30
         ):
             return self._token
+        return None
 
+    async def _get_oauth_token(self) -> str:
+        token = self._cached_token()
+        if token:
+            return token
+
+        # Parallel ticket calls that find the token expired wait for a single
+        # refresh instead of each requesting their own.
+        async with self._token_lock:
+            token = self._cached_token()
+            if token:
+                return token
+            return await self._request_oauth_token()
+
+    async def _request_oauth_token(self) -> str:
         if not all(
             [self._config.token_url, self._config.client_id, self._config.client_secret]
         ):
@@ -105,27 +155,26 @@ class ServiceNowClient:
                 "ServiceNow OAuth configuration is incomplete (token_url/client credentials required)"
             )
 
-        async with httpx.AsyncClient(timeout=self._config.timeout) as client:
-            response = await client.post(
-                self._config.token_url,
-                data={
-                    "grant_type": "client_credentials",
-                    "client_id": self._config.client_id,
-                    "client_secret": self._config.client_secret,
-                },
+        response = await self._http().post(
+            self._config.token_url,
+            data={
+                "grant_type": "client_credentials",
+                "client_id": self._config.client_id,
+                "client_secret": self._config.client_secret,
+            },
+        )
+        if response.status_code >= 400:
+            raise TicketClientError(
+                f"ServiceNow OAuth token request failed with status {response.status_code}: {response.text}"
             )
-            if response.status_code >= 400:
-                raise TicketClientError(
-                    f"ServiceNow OAuth token request failed with status {response.status_code}: {response.text}"
-                )
-            payload = response.json()
-            token = payload.get("access_token")
-            expires_in = payload.get("expires_in", 1800)
-            if not token:
-                raise TicketClientError("ServiceNow OAuth token response missing access_token")
-            self._token = token
-            self._token_expiry = time.monotonic() + int(expires_in)
-            return token
+        payload = response.json()
+        token = payload.get("access_token")
+        expires_in = payload.get("expires_in", 1800)
+        if not token:
+            raise TicketClientError("ServiceNow OAuth token response missing access_token")
+        self._token = token
+        self._token_expiry = time.monotonic() + int(expires_in)
+        return token
 
     def _build_headers(self) -> Dict[str, str]:
         headers = {"Accept": "application/json", "Content-Type": "application/json"}
@@ -167,17 +216,14 @@ class ServiceNowClient:
             # Basic auth already encoded in header
             pass
 
-        async with httpx.AsyncClient(
-            timeout=self._config.timeout, verify=self._config.verify_ssl
-        ) as client:
-            response = await client.request(
-                method,
-                url,
-                headers=headers,
-                json=json_payload,
-                params=params,
-                auth=auth,
-            )
+        response = await self._http().request(
+            method,
+            url,
+            headers=headers,
+            json=json_payload,
+            params=params,
+            auth=auth,
+        )
         if response.status_code >= 400:
             raise TicketClientError(
                 f"ServiceNow API responded with {response.status_code}: {response.text}"
@@ -244,7 +290,7 @@ class ServiceNowClient:
         return None
 
 
-class JiraClient:
+class JiraClient(_PooledHTTPClient):
     """Thin wrapper around the Jira issue REST API."""
 
     def __init__(self, config: JiraClientConfig) -> None:
@@ -342,12 +388,9 @@ class JiraClient:
             raise TicketClientError("Jira client is not configured with a base URL")
         url = f"{self._config.base_url.rstrip('/')}/{path.lstrip('/')}"
         headers = self._build_headers()
-        async with httpx.AsyncClient(
-            timeout=self._config.timeout, verify=self._config.verify_ssl
-        ) as client:
-            response = await client.request(
-                method, url, headers=headers, json=json_payload, params=params
-            )
+        response = await self._http().request(
+            method, url, headers=headers, json=json_payload, params=params
+        )
         if response.status_code >= 400:
             raise TicketClientError(
                 f"Jira API responded with {response.status_code}: {response.text}"
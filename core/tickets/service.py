@@ -4,16 +4,18 @@ Service helpers for ITSM ticket orchestration and persistence.
 
 from __future__ import annotations
 
+import asyncio
 import uuid
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Any, Dict, Iterable, List, Optional, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
 
-from sqlalchemy import select
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from core.config import settings
 from core.db.database import get_db_session
-from core.db.models import Ticket
+from core.db.models import Job, Ticket
 from core.jobs.service import JobService
 from core.logging import get_logger
 from core.tickets.clients import (
@@ -28,6 +30,22 @@ from core.tickets.settings import TicketSettingsService, TicketToggleState
 
 logger = get_logger(__name__)
 
+# Job identifiers may be passed as validated ``UUID`` objects straight from the
+# API layer; SQLAlchemy binds them without re-parsing a string.
+JobId = Union[str, uuid.UUID]
+
+
+class JobNotFoundError(ValueError):
+    """Raised when a ticket operation targets a job that does not exist."""
+
+
+@dataclass(slots=True)
+class TicketDispatchResult:
+    """Tickets recorded by a dispatch plus the error of each failed platform."""
+
+    tickets: List[Ticket] = field(default_factory=list)
+    errors: Dict[str, str] = field(default_factory=dict)
+
 
 def _utcnow() -> datetime:
     return datetime.now(timezone.utc)
@@ -41,10 +59,14 @@ def _clean_payload(payload: Dict[str, Any]) -> Dict[str, Any]:
 class TicketService:
     """Persist and orchestrate ITSM ticket metadata associated with RCA jobs."""
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        job_service: Optional[JobService] = None,
+        settings_service: Optional[TicketSettingsService] = None,
+    ) -> None:
         self._session_factory = get_db_session()
-        self._job_service = JobService()
-        self._settings_service = TicketSettingsService()
+        self._job_service = job_service or JobService()
+        self._settings_service = settings_service or TicketSettingsService()
 
         ticketing = settings.ticketing
         self._servicenow_client: Optional[ServiceNowClient] = None
@@ -89,7 +111,7 @@ class TicketService:
                 severity = "moderate"
         return severity or "low"
 
-    def _servicenow_defaults(self, job_dict: Dict[str, Any], job_id: str) -> Dict[str, Any]:
+    def _servicenow_defaults(self, job_dict: Dict[str, Any], job_id: JobId) -> Dict[str, Any]:
         severity = self._severity(job_dict)
         priority_map = {"critical": "1", "high": "2", "moderate": "3", "low": "4"}
         priority = priority_map.get(severity, settings.ticketing.SERVICENOW_DEFAULT_PRIORITY or "3")
@@ -143,7 +165,7 @@ class TicketService:
             }
         )
 
-    def _jira_defaults(self, job_dict: Dict[str, Any], job_id: str) -> Dict[str, Any]:
+    def _jira_defaults(self, job_dict: Dict[str, Any], job_id: JobId) -> Dict[str, Any]:
         severity = self._severity(job_dict)
         summary = job_dict.get("summary") or f"RCA outcome for job {job_id}"
         actions = job_dict.get("recommended_actions") or []
@@ -186,10 +208,10 @@ class TicketService:
             }
         )
 
-    async def _load_job_context(self, job_id: str) -> Dict[str, Any]:
+    async def _load_job_context(self, job_id: JobId) -> Dict[str, Any]:
         job = await self._job_service.get_job(job_id)
         if job is None:
-            raise ValueError(f"Job {job_id} not found")
+            raise JobNotFoundError(f"Job {job_id} not found")
 
         structured: Dict[str, Any] = {}
         if job.outputs and isinstance(job.outputs, dict):
@@ -199,13 +221,18 @@ class TicketService:
             if isinstance(outputs, dict):
                 structured = outputs.get("json") or outputs
         structured = structured or {}
-        structured.setdefault("job", {"id": job_id, "user_id": job.user_id})
+        structured.setdefault("job", {"id": str(job_id), "user_id": job.user_id})
         return structured
 
     async def _prepare_payload(
-        self, job_id: str, platform: str, overrides: Optional[Dict[str, Any]]
+        self,
+        job_id: JobId,
+        platform: str,
+        overrides: Optional[Dict[str, Any]],
+        job_dict: Optional[Dict[str, Any]] = None,
     ) -> Dict[str, Any]:
-        job_dict = await self._load_job_context(job_id)
+        if job_dict is None:
+            job_dict = await self._load_job_context(job_id)
         if platform == "servicenow":
             defaults = self._servicenow_defaults(job_dict, job_id)
         elif platform == "jira":
@@ -236,7 +263,7 @@ class TicketService:
         self,
         session: AsyncSession,
         *,
-        job_id: str,
+        job_id: JobId,
         platform: str,
         ticket_id: str,
         url: Optional[str],
@@ -262,7 +289,8 @@ class TicketService:
         await session.refresh(record)
 
         await self._job_service.create_job_event(
-            job_id,
+            # Event bus channels are keyed by the string form.
+            str(job_id),
             "ticket-created",
             {
                 "ticket_id": ticket_id,
@@ -276,7 +304,7 @@ class TicketService:
 
     async def create_ticket(
         self,
-        job_id: str,
+        job_id: JobId,
         platform: str,
         payload: Optional[Dict[str, Any]] = None,
         *,
@@ -285,15 +313,24 @@ class TicketService:
         ticket_id: Optional[str] = None,
         url: Optional[str] = None,
         metadata: Optional[Dict[str, Any]] = None,
+        toggles: Optional[TicketToggleState] = None,
+        job_context: Optional[Dict[str, Any]] = None,
     ) -> Ticket:
-        """Create or persist a ticket record for the supplied platform."""
+        """Create or persist a ticket record for the supplied platform.
+
+        ``toggles`` and ``job_context`` let batch callers reuse state they
+        already loaded instead of fetching it again per platform.
+        """
         overrides = payload or {}
         metadata = metadata or {}
 
-        toggles = await self._get_toggle_state()
+        if toggles is None:
+            toggles = await self._get_toggle_state()
         platform_enabled = platform in toggles.active_platforms
 
-        prepared_payload = await self._prepare_payload(job_id, platform, overrides)
+        prepared_payload = await self._prepare_payload(
+            job_id, platform, overrides, job_context
+        )
         final_ticket_id = ticket_id or f"{platform}-{uuid.uuid4().hex[:8]}"
         final_url = url
         status = "dry-run"
@@ -354,30 +391,70 @@ class TicketService:
 
     async def create_enabled_tickets(
         self,
-        job_id: str,
+        job_id: JobId,
         *,
         payloads: Optional[Dict[str, Dict[str, Any]]] = None,
         profile_name: Optional[str] = None,
         dry_run: bool = False,
-    ) -> List[Ticket]:
+    ) -> TicketDispatchResult:
         """
         Create tickets for all enabled platforms honouring dual-tracking mode.
+
+        A platform that fails is reported in ``errors`` instead of discarding
+        the tickets already recorded for the others.
         """
         payloads = payloads or {}
-        toggles = await self._get_toggle_state()
-        created: List[Ticket] = []
+        # The toggle state and job context are independent lookups; loading
+        # the context also verifies that the job exists.
+        toggles, job_context = await asyncio.gather(
+            self._get_toggle_state(), self._load_job_context(job_id)
+        )
+        result = TicketDispatchResult()
         servicenow_ticket: Optional[Ticket] = None
 
+        if not toggles.dual_tracking:
+            # Without dual tracking the Jira issue does not reference the
+            # ServiceNow incident, so the remote calls can overlap. A transport
+            # failure on one platform must not hide the other's ticket.
+            platforms = list(toggles.active_platforms)
+            outcomes = await asyncio.gather(
+                *(
+                    self.create_ticket(
+                        job_id,
+                        platform,
+                        payloads.get(platform),
+                        profile_name=profile_name,
+                        dry_run=dry_run,
+                        toggles=toggles,
+                        job_context=job_context,
+                    )
+                    for platform in platforms
+                ),
+                return_exceptions=True,
+            )
+            for platform, outcome in zip(platforms, outcomes):
+                if isinstance(outcome, BaseException):
+                    self._record_dispatch_error(result, job_id, platform, outcome)
+                else:
+                    result.tickets.append(outcome)
+            return result
+
         if toggles.servicenow_enabled:
             sn_payload = payloads.get("servicenow")
-            servicenow_ticket = await self.create_ticket(
-                job_id,
-                "servicenow",
-                sn_payload,
-                profile_name=profile_name,
-                dry_run=dry_run,
-            )
-            created.append(servicenow_ticket)
+            try:
+                servicenow_ticket = await self.create_ticket(
+                    job_id,
+                    "servicenow",
+                    sn_payload,
+                    profile_name=profile_name,
+                    dry_run=dry_run,
+                    toggles=toggles,
+                    job_context=job_context,
+                )
+            except Exception as exc:
+                self._record_dispatch_error(result, job_id, "servicenow", exc)
+            else:
+                result.tickets.append(servicenow_ticket)
 
         if toggles.jira_enabled:
             jira_overrides = dict(payloads.get("jira") or {})
@@ -398,32 +475,66 @@ class TicketService:
                     "url": servicenow_ticket.url,
                 }
 
-            jira_ticket = await self.create_ticket(
-                job_id,
-                "jira",
-                jira_overrides,
-                profile_name=profile_name,
-                dry_run=dry_run,
-                metadata=jira_metadata or None,
-            )
-            created.append(jira_ticket)
+            try:
+                jira_ticket = await self.create_ticket(
+                    job_id,
+                    "jira",
+                    jira_overrides,
+                    profile_name=profile_name,
+                    dry_run=dry_run,
+                    metadata=jira_metadata or None,
+                    toggles=toggles,
+                    job_context=job_context,
+                )
+            except Exception as exc:
+                self._record_dispatch_error(result, job_id, "jira", exc)
+            else:
+                result.tickets.append(jira_ticket)
+
+        return result
 
-        return created
+    @staticmethod
+    def _record_dispatch_error(
+        result: TicketDispatchResult,
+        job_id: JobId,
+        platform: str,
+        exc: BaseException,
+    ) -> None:
+        if not isinstance(exc, Exception):
+            # Cancellation and interpreter exits are not platform failures.
+            raise exc
+        logger.error(
+            "Ticket dispatch to %s failed for job %s: %s",
+            platform,
+            job_id,
+            exc,
+            exc_info=exc,
+        )
+        result.errors[platform] = str(exc) or type(exc).__name__
 
     async def list_job_tickets(
         self,
-        job_id: str,
+        job_id: JobId,
         *,
         refresh: bool = False,
     ) -> List[Ticket]:
-        """Return tickets associated with a given job."""
+        """Return tickets associated with a given job.
+
+        Raises :class:`JobNotFoundError` when the job itself does not exist; the
+        check shares the ticket query's round-trip via an outer join.
+        """
         async with self._session_factory() as session:
             result = await session.execute(
-                select(Ticket)
-                .where(Ticket.job_id == job_id)
+                select(Job.id, Ticket)
+                .outerjoin(Ticket, Ticket.job_id == Job.id)
+                .where(Job.id == job_id)
                 .order_by(Ticket.created_at.asc())
             )
-            tickets = result.scalars().all()
+            rows = result.all()
+
+        if not rows:
+            raise JobNotFoundError(f"Job {job_id} not found")
+        tickets = [ticket for _, ticket in rows if ticket is not None]
 
         if refresh and tickets:
             await self._refresh_ticket_batch(tickets)
@@ -482,7 +593,8 @@ class TicketService:
                         .values(
                             status=status_payload.get("status"),
                             metadata=metadata,
-                            updated_at=_utcnow(),
+                            # Stamped by the database, consistent across the batch.
+                            updated_at=func.now(),
                         )
                     )
 
@@ -490,3 +602,9 @@ class TicketService:
         """Fetch ticket by primary key."""
         async with self._session_factory() as session:
             return await session.get(Ticket, ticket_id)
+
+    async def close(self) -> None:
+        """Close the pooled ITSM connections held by the platform clients."""
+        for client in (self._servicenow_client, self._jira_client):
+            if client is not None:
+                await client.close()
@@ -8,8 +8,10 @@ backend while providing an in-process fallback for development and tests.
 from __future__ import annotations
 
 import asyncio
-import json
-from typing import AsyncIterator, Dict, List, Optional
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+import orjson
 
 try:
     import redis.asyncio as redis  # type: ignore[attr-defined]
@@ -22,6 +24,21 @@ from core.logging import get_logger
 logger = get_logger(__name__)
 
 
+@dataclass(slots=True)
+class WatcherEnvelope:
+    """A watcher event encoded once and shared by every local subscriber."""
+
+    data: str
+    _payload: Optional[Dict[str, Any]] = field(default=None, repr=False, compare=False)
+
+    @property
+    def payload(self) -> Dict[str, Any]:
+        """Decoded payload, parsed at most once per envelope."""
+        if self._payload is None:
+            self._payload = orjson.loads(self.data)
+        return self._payload
+
+
 class WatcherEventBus:
     """Lightweight publish/subscribe helper for watcher events."""
 
@@ -34,7 +51,7 @@ class WatcherEventBus:
             and bool(settings.redis.REDIS_URL)
             and redis is not None
         )
-        self._local_subscribers: List[asyncio.Queue[str]] = []
+        self._local_subscribers: List[asyncio.Queue[WatcherEnvelope]] = []
         self._lock = asyncio.Lock()
 
     async def _ensure_redis(self) -> Optional["redis.Redis"]:
@@ -60,7 +77,7 @@ class WatcherEventBus:
 
     async def publish(self, payload: Dict[str, object]) -> None:
         """Publish a watcher event payload."""
-        serialised = json.dumps(payload, default=str)
+        serialised = orjson.dumps(payload, default=str).decode("utf-8")
 
         redis_client = await self._ensure_redis()
         if redis_client is not None:
@@ -72,14 +89,20 @@ class WatcherEventBus:
         async with self._lock:
             subscribers = list(self._local_subscribers)
 
+        envelope = WatcherEnvelope(serialised)
         for queue in subscribers:
             try:
-                queue.put_nowait(serialised)
+                queue.put_nowait(envelope)
             except asyncio.QueueFull:  # pragma: no cover - defensive
                 logger.debug("Local watcher event queue full, dropping payload")
 
     async def subscribe(self) -> AsyncIterator[Dict]:
         """Subscribe to watcher events."""
+        async for envelope in self.subscribe_envelopes():
+            yield envelope.payload
+
+    async def subscribe_envelopes(self) -> AsyncIterator[WatcherEnvelope]:
+        """Subscribe to watcher events without decoding their payloads."""
         redis_client = await self._ensure_redis()
         if redis_client is not None:
             pubsub = redis_client.pubsub(ignore_subscribe_messages=True)
@@ -91,7 +114,7 @@ class WatcherEventBus:
                     data = message.get("data")
                     if not data:
                         continue
-                    yield json.loads(data)
+                    yield WatcherEnvelope(data)
             finally:
                 try:
                     await pubsub.unsubscribe(self._CHANNEL)
@@ -99,14 +122,13 @@ class WatcherEventBus:
                     await pubsub.close()
             return
 
-        queue: asyncio.Queue[str] = asyncio.Queue()
+        queue: asyncio.Queue[WatcherEnvelope] = asyncio.Queue()
         async with self._lock:
             self._local_subscribers.append(queue)
 
         try:
             while True:
-                data = await queue.get()
-                yield json.loads(data)
+                yield await queue.get()
         finally:
             async with self._lock:
                 if queue in self._local_subscribers:
@@ -121,4 +143,4 @@ class WatcherEventBus:
 
 watcher_event_bus = WatcherEventBus()
 
-__all__ = ["WatcherEventBus", "watcher_event_bus"]
+__all__ = ["WatcherEnvelope", "WatcherEventBus", "watcher_event_bus"]
@@ -4,8 +4,11 @@ Service layer for watcher configuration and event persistence.
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional
+import asyncio
+import time
+from typing import Any, Dict, List, Optional, Tuple
 
+import orjson
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -17,6 +20,10 @@ from core.watchers.event_bus import watcher_event_bus
 
 logger = get_logger(__name__)
 
+# Dashboards poll the status endpoint; its aggregate counts are reused for
+# this long unless this process changes the watcher state itself.
+STATUS_CACHE_TTL_SECONDS = 5.0
+
 
 class WatcherService:
     """Manage watcher configuration and surface activity events."""
@@ -24,6 +31,8 @@ class WatcherService:
     def __init__(self) -> None:
         self._session_factory = get_db_session()
         self._event_bus = watcher_event_bus
+        self._status_cache: Optional[Tuple[float, Dict[str, Any]]] = None
+        self._status_lock = asyncio.Lock()
 
     @staticmethod
     def _normalise_list(value: Optional[Any]) -> Optional[List[str]]:
@@ -91,6 +100,7 @@ class WatcherService:
                 await session.flush()
                 await session.refresh(config)
 
+            self._status_cache = None
             await self._event_bus.publish(
                 {"event_type": "config-updated", "config": config.to_dict()}
             )
@@ -119,6 +129,7 @@ class WatcherService:
                 await session.flush()
                 await session.refresh(event)
 
+            self._status_cache = None
             await self._event_bus.publish(event.to_dict())
             return event
 
@@ -133,8 +144,48 @@ class WatcherService:
             events = list(result.scalars().all())
             return list(reversed(events))
 
+    async def list_recent_event_frames(self, limit: int = 100) -> List[Tuple[str, bytes]]:
+        """Return ``(event_type, json)`` pairs for the most recent watcher events.
+
+        Columns are read directly rather than as ORM entities and each row is
+        encoded straight to JSON matching :meth:`WatcherEvent.to_dict`, ready
+        to stream without further conversion.
+        """
+        columns = (
+            WatcherEvent.id,
+            WatcherEvent.watcher_id,
+            WatcherEvent.job_id,
+            WatcherEvent.event_type,
+            WatcherEvent.payload,
+            WatcherEvent.created_at,
+        )
+        async with self._session_factory() as session:
+            result = await session.execute(
+                select(*columns).order_by(WatcherEvent.created_at.desc()).limit(limit)
+            )
+            rows = result.all()
+
+        return [
+            (row.event_type, orjson.dumps(row._asdict()))
+            for row in reversed(rows)
+        ]
+
     async def get_status(self) -> Dict[str, Any]:
-        """Return watcher runtime status including recent activity."""
+        """Return watcher runtime status including recent activity.
+
+        Results are cached for ``STATUS_CACHE_TTL_SECONDS`` and concurrent
+        misses share a single query.
+        """
+        async with self._status_lock:
+            cached = self._status_cache
+            if cached is not None and cached[0] > time.monotonic():
+                return dict(cached[1])
+
+            status = await self._load_status()
+            self._status_cache = (time.monotonic() + STATUS_CACHE_TTL_SECONDS, status)
+            return dict(status)
+
+    async def _load_status(self) -> Dict[str, Any]:
         async with self._session_factory() as session:
             async with session.begin():
                 config = await self._ensure_config(session)
@@ -14,6 +14,7 @@ setup(
         "uvicorn[standard]>=0.24.0",
         "pydantic>=2.5.0",
         "pydantic-settings>=2.1.0",
+        "orjson>=3.8.3",
         "sqlalchemy>=2.0.23",
         "asyncpg>=0.29.0",
         "alembic>=1.13.0",
@@ -0,0 +1,34 @@
+"""Tests for the SSE admission controller."""
+
+import asyncio
+
+import pytest
+
+from apps.api.admission import AdmissionController
+
+
+@pytest.mark.asyncio
+async def test_try_acquire_rejects_above_cap_and_release_is_idempotent():
+    controller = AdmissionController(c_max=1)
+
+    slot = await controller.try_acquire()
+    assert slot is not None
+    assert await controller.try_acquire() is None
+
+    await slot.release()
+    await slot.release()
+    assert controller.active == 0
+    assert await controller.try_acquire() is not None
+
+
+@pytest.mark.asyncio
+async def test_resize_wakes_waiters():
+    controller = AdmissionController(c_max=0)
+    waiter = asyncio.create_task(controller.acquire())
+    await asyncio.sleep(0)
+    assert not waiter.done()
+
+    await controller.resize(1)
+    slot = await asyncio.wait_for(waiter, 1)
+    assert controller.active == 1
+    await slot.release()
@@ -0,0 +1,64 @@
+"""Tests for the SSE-aware gzip middleware."""
+
+import asyncio
+import zlib
+
+import pytest
+from starlette.responses import StreamingResponse
+
+from apps.api.middleware.gzip import StreamingGZipMiddleware
+
+
+def _scope():
+    return {
+        "type": "http",
+        "method": "GET",
+        "path": "/",
+        "headers": [(b"accept-encoding", b"gzip")],
+    }
+
+
+async def _receive():
+    # The client never disconnects while the response streams.
+    await asyncio.Event().wait()
+
+
+async def _run(media_type):
+    frames = [b"event: message\ndata: {\"n\": 1}\n\n", b"event: message\ndata: {\"n\": 2}\n\n"]
+
+    async def stream():
+        for frame in frames:
+            yield frame
+
+    app = StreamingGZipMiddleware(StreamingResponse(stream(), media_type=media_type))
+    messages = []
+
+    async def send(message):
+        messages.append(message)
+
+    await app(_scope(), _receive, send)
+    return frames, [m["body"] for m in messages if m["type"] == "http.response.body"]
+
+
+@pytest.mark.asyncio
+async def test_event_stream_frames_are_decodable_as_they_arrive():
+    frames, bodies = await _run("text/event-stream")
+
+    decoder = zlib.decompressobj(wbits=31)
+    assert decoder.decompress(bodies[0]) == frames[0]
+    assert decoder.decompress(bodies[1]) == frames[1]
+
+
+@pytest.mark.asyncio
+async def test_other_streams_keep_default_buffering():
+    frames, bodies = await _run("application/octet-stream")
+
+    assert zlib.decompressobj(wbits=31).decompress(bodies[0]) == b""
+    assert zlib.decompress(b"".join(bodies), wbits=31) == b"".join(frames)
+
+
+@pytest.mark.asyncio
+async def test_event_stream_is_one_complete_gzip_member():
+    frames, bodies = await _run("text/event-stream")
+
+    assert zlib.decompress(b"".join(bodies), wbits=31) == b"".join(frames)
@@ -0,0 +1,35 @@
+"""Tests for the Postgres notification listener used by job pollers."""
+
+import pytest
+
+from core.jobs.notify_listener import JobNotifyListener
+
+
+class FakeConnection:
+    def is_closed(self):
+        return False
+
+
+@pytest.mark.asyncio
+async def test_notifications_wake_only_watchers_of_that_job():
+    listener = JobNotifyListener()
+    listener._connection = FakeConnection()
+
+    watched = await listener.watch("job-1")
+    other = await listener.watch("job-2")
+    listener._on_notify(None, 0, "job_events", "job-1")
+
+    assert watched.is_set()
+    assert not other.is_set()
+
+    listener.unwatch("job-1", watched)
+    listener.unwatch("job-2", other)
+    assert listener._watchers == {}
+
+
+@pytest.mark.asyncio
+async def test_watch_returns_none_while_listener_is_unavailable(monkeypatch):
+    listener = JobNotifyListener()
+    monkeypatch.setattr("core.jobs.notify_listener.asyncpg", None)
+
+    assert await listener.watch("job-1") is None
@@ -0,0 +1,256 @@
+"""Tests for JobService lookups and queries."""
+
+from __future__ import annotations
+
+import json
+import uuid
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import create_engine, update
+from sqlalchemy.orm import Session
+from sqlalchemy.schema import CreateTable
+
+from backend.api.routers import jobs as job_routes
+from backend.api.routers.jobs import POLL_BATCH_SIZE
+from core.db.models import Job, JobEvent
+from core.jobs.service import JobService
+
+BASE_TIME = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+def _uuid(index: int) -> uuid.UUID:
+    # SQLite stores the UUID type with numeric affinity; a leading hex letter
+    # keeps ids stored as text while preserving their order.
+    return uuid.UUID(int=(0xA << 124) + index)
+
+
+class StubSession:
+    def __init__(self, owners):
+        self.owners = owners
+        self.queries = 0
+
+    async def execute(self, statement):
+        self.queries += 1
+        job_id = statement.whereclause.right.value
+        return SimpleNamespace(scalar_one_or_none=lambda: self.owners.get(job_id))
+
+
+def _service(session: StubSession) -> JobService:
+    service = JobService()
+
+    @asynccontextmanager
+    async def session_factory():
+        yield session
+
+    service._session_factory = session_factory
+    return service
+
+
+@pytest.mark.asyncio
+async def test_get_job_owner_caches_found_jobs():
+    session = StubSession({"job-1": "user-1"})
+    service = _service(session)
+
+    assert await service.get_job_owner("job-1") == "user-1"
+    assert await service.get_job_owner("job-1") == "user-1"
+    assert session.queries == 1
+
+
+@pytest.mark.asyncio
+async def test_get_job_owner_does_not_cache_missing_jobs():
+    session = StubSession({})
+    service = _service(session)
+
+    assert await service.get_job_owner("job-2") is None
+    session.owners["job-2"] = "user-2"
+    assert await service.get_job_owner("job-2") == "user-2"
+    assert session.queries == 2
+
+
+class SQLiteSession:
+    """Runs the service's statements on an in-memory SQLite database."""
+
+    def __init__(self, session: Session) -> None:
+        self._session = session
+
+    async def execute(self, statement):
+        return self._session.execute(statement)
+
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite://")
+    with engine.begin() as connection:
+        # Only the tables the queries touch; indexes are irrelevant here.
+        connection.execute(CreateTable(Job.__table__))
+        connection.execute(CreateTable(JobEvent.__table__))
+    with Session(engine, expire_on_commit=False) as session:
+        yield session
+    engine.dispose()
+
+
+@pytest.fixture
+def sqlite_service(db: Session) -> JobService:
+    service = JobService()
+
+    @asynccontextmanager
+    async def session_factory():
+        yield SQLiteSession(db)
+
+    service._session_factory = session_factory
+    return service
+
+
+def _add_jobs(db: Session, count: int, created_at: datetime = BASE_TIME) -> list:
+    jobs = [
+        Job(
+            id=_uuid(index + 1),
+            job_type="rca",
+            status="pending",
+            user_id="user-1",
+            input_manifest={},
+            created_at=created_at,
+        )
+        for index in range(count)
+    ]
+    db.add_all(jobs)
+    db.commit()
+    return jobs
+
+
+@pytest.mark.asyncio
+async def test_job_projections_page_on_created_at_and_id(db, sqlite_service):
+    # Every job shares a timestamp, so only the id keeps pages apart.
+    jobs = _add_jobs(db, 5)
+
+    first, first_key = await sqlite_service.get_user_job_projections(limit=2)
+    second, second_key = await sqlite_service.get_user_job_projections(
+        limit=2, before=first_key
+    )
+    last, _ = await sqlite_service.get_user_job_projections(limit=2, before=second_key)
+
+    ids = [json.loads(projection)["id"] for projection in first + second + last]
+    assert ids == [str(job.id) for job in reversed(jobs)]
+    assert first_key[1] == jobs[3].id
+
+
+@pytest.mark.asyncio
+async def test_job_projections_ignore_offset_with_cursor(db, sqlite_service):
+    _add_jobs(db, 4)
+
+    _, key = await sqlite_service.get_user_job_projections(limit=1)
+    with_offset, _ = await sqlite_service.get_user_job_projections(
+        limit=1, offset=2, before=key
+    )
+    without_offset, _ = await sqlite_service.get_user_job_projections(limit=1, before=key)
+
+    assert with_offset == without_offset
+
+
+@pytest.mark.asyncio
+async def test_job_projections_render_rows_without_stored_projection(db, sqlite_service):
+    jobs = _add_jobs(db, 2)
+    db.execute(update(Job).where(Job.id == jobs[0].id).values(projection_json=None))
+    db.commit()
+
+    projections, _ = await sqlite_service.get_user_job_projections()
+
+    assert [json.loads(projection)["id"] for projection in projections] == [
+        str(jobs[1].id),
+        str(jobs[0].id),
+    ]
+    assert json.loads(projections[1])["status"] == "pending"
+
+
+def _add_events(db: Session, job: Job, count: int) -> list:
+    # Pairs of events share a timestamp so paging has to break ties on id.
+    events = [
+        JobEvent(
+            id=_uuid(1000 + index),
+            job_id=job.id,
+            event_type="progress",
+            data={"index": index},
+            created_at=BASE_TIME + timedelta(seconds=index // 2),
+        )
+        for index in range(count)
+    ]
+    db.add_all(events)
+    db.commit()
+    return events
+
+
+@pytest.mark.asyncio
+async def test_status_and_events_for_missing_job(sqlite_service):
+    assert await sqlite_service.get_job_status_and_new_events(_uuid(99)) == (None, [])
+
+
+@pytest.mark.asyncio
+async def test_status_and_events_for_job_without_events(db, sqlite_service):
+    job = _add_jobs(db, 1)[0]
+
+    assert await sqlite_service.get_job_status_and_new_events(job.id) == ("pending", [])
+
+
+@pytest.mark.asyncio
+async def test_status_and_events_resume_after_id_on_shared_timestamp(db, sqlite_service):
+    job = _add_jobs(db, 1)[0]
+    events = _add_events(db, job, 4)
+
+    # events[0] and events[1] share a timestamp; only the id separates them.
+    _, after_first = await sqlite_service.get_job_status_and_new_events(
+        job.id, since=events[0].created_at, after_id=events[0].id
+    )
+    _, after_time = await sqlite_service.get_job_status_and_new_events(
+        job.id, since=events[0].created_at
+    )
+
+    assert [event.id for event in after_first] == [event.id for event in events[1:]]
+    assert [event.id for event in after_time] == [event.id for event in events[2:]]
+
+
+@pytest.mark.asyncio
+async def test_status_and_events_page_past_batch_size_on_terminal_job(db, sqlite_service):
+    job = _add_jobs(db, 1)[0]
+    events = _add_events(db, job, POLL_BATCH_SIZE * 2 + 100)
+    db.execute(update(Job).where(Job.id == job.id).values(status="completed"))
+    db.commit()
+
+    seen = []
+    since = after_id = None
+    while True:
+        job_status, batch = await sqlite_service.get_job_status_and_new_events(
+            job.id, since=since, after_id=after_id, limit=POLL_BATCH_SIZE
+        )
+        assert job_status == "completed"
+        seen.extend(event.id for event in batch)
+        if len(batch) < POLL_BATCH_SIZE:
+            break
+        since, after_id = batch[-1].created_at, batch[-1].id
+
+    assert seen == [event.id for event in events]
+
+
+@pytest.mark.asyncio
+async def test_poller_drains_backlog_before_honouring_terminal_status(
+    db, sqlite_service, monkeypatch
+):
+    job = _add_jobs(db, 1)[0]
+    events = _add_events(db, job, POLL_BATCH_SIZE * 2 + 100)
+    db.execute(update(Job).where(Job.id == job.id).values(status="completed"))
+    db.commit()
+
+    async def no_listener(job_id):
+        return None
+
+    monkeypatch.setattr(job_routes, "get_job_service", lambda: sqlite_service)
+    monkeypatch.setattr(job_routes.job_notify_listener, "watch", no_listener)
+
+    frames = [
+        chunk async for is_heartbeat, chunk in job_routes._poll_job_events(job.id)
+        if not is_heartbeat
+    ]
+
+    assert len(frames) == len(events)
@@ -0,0 +1,86 @@
+"""Tests for keyset pagination on the jobs listing endpoint."""
+
+import base64
+import uuid
+from datetime import datetime, timezone
+
+import pytest
+from fastapi import FastAPI
+from httpx import AsyncClient
+
+from apps.api.dependencies import get_job_service
+from apps.api.routers import jobs
+
+LAST_KEY = (datetime(2026, 1, 1, 12, 30, tzinfo=timezone.utc), uuid.UUID(int=7))
+
+
+class StubJobService:
+    """Returns ``count`` projections and records the listing arguments."""
+
+    def __init__(self, count: int) -> None:
+        self.count = count
+        self.calls = []
+
+    async def get_user_job_projections(self, **kwargs):
+        self.calls.append(kwargs)
+        projections = ['{"id":"%d"}' % index for index in range(self.count)]
+        return projections, LAST_KEY if projections else None
+
+
+def _client(service: StubJobService) -> AsyncClient:
+    app = FastAPI()
+    app.include_router(jobs.router, prefix="/api/jobs")
+    app.dependency_overrides[get_job_service] = lambda: service
+    return AsyncClient(app=app, base_url="http://testserver")
+
+
+def test_cursor_round_trips():
+    assert jobs._decode_cursor(jobs._encode_cursor(LAST_KEY)) == LAST_KEY
+
+
+@pytest.mark.asyncio
+async def test_full_page_sets_next_cursor():
+    service = StubJobService(count=2)
+    async with _client(service) as client:
+        response = await client.get("/api/jobs/", params={"limit": 2})
+
+    assert response.status_code == 200
+    assert response.json() == [{"id": "0"}, {"id": "1"}]
+    assert jobs._decode_cursor(response.headers["X-Next-Cursor"]) == LAST_KEY
+
+
+@pytest.mark.asyncio
+async def test_short_page_has_no_next_cursor():
+    service = StubJobService(count=1)
+    async with _client(service) as client:
+        response = await client.get("/api/jobs/", params={"limit": 2})
+
+    assert response.status_code == 200
+    assert "X-Next-Cursor" not in response.headers
+
+
+@pytest.mark.asyncio
+async def test_cursor_is_passed_as_keyset_bound():
+    service = StubJobService(count=0)
+    cursor = jobs._encode_cursor(LAST_KEY)
+    async with _client(service) as client:
+        response = await client.get("/api/jobs/", params={"cursor": cursor, "offset": 5})
+
+    assert response.status_code == 200
+    assert response.json() == []
+    assert service.calls[0]["before"] == LAST_KEY
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "cursor",
+    ["not base64!", base64.urlsafe_b64encode(b"no-separator").decode(), "//79"],
+)
+async def test_malformed_cursor_is_rejected(cursor):
+    service = StubJobService(count=0)
+    async with _client(service) as client:
+        response = await client.get("/api/jobs/", params={"cursor": cursor})
+
+    assert response.status_code == 422
+    assert response.json()["detail"] == "Invalid pagination cursor"
+    assert not service.calls
@@ -26,3 +26,17 @@ def test_logger_with_context():
     
     # This should not raise an exception
     logger.info("Test message with context")
+
+
+def test_job_context_filter_stamps_current_job():
+    """Test that the job id context variable is attached to records."""
+    from core.logging import JobContextFilter, job_id_context
+
+    record = logging.LogRecord("sse", logging.INFO, __file__, 1, "msg", None, None)
+    token = job_id_context.set("job-123")
+    try:
+        assert JobContextFilter().filter(record)
+    finally:
+        job_id_context.reset(token)
+
+    assert record.job_id == "job-123"
@@ -0,0 +1,107 @@
+"""Tests for the shared job event fan-out hub."""
+
+import asyncio
+
+import pytest
+
+from core.jobs.event_bus import JobEventBus
+from core.jobs.pubsub_hub import PubSubHub, SubscriberQueue
+
+
+class StubBus(JobEventBus):
+    """Event bus that counts subscriptions and replays pushed payloads."""
+
+    def __init__(self) -> None:
+        self.subscriptions = 0
+        self.queue: asyncio.Queue = asyncio.Queue()
+
+    async def subscribe_raw(self, job_id: str):
+        self.subscriptions += 1
+        while True:
+            yield await self.queue.get()
+
+
+@pytest.mark.asyncio
+async def test_subscribers_share_one_bus_subscription():
+    bus = StubBus()
+    hub = PubSubHub(bus)
+
+    first = hub.subscribe("job-1")
+    second = hub.subscribe("job-1")
+    await asyncio.sleep(0)
+
+    await bus.queue.put('{"event_type":"progress"}')
+    expected = ("event", {"event_type": "progress"}, '{"event_type":"progress"}')
+    assert await asyncio.wait_for(first.get(), 1) == expected
+    assert await asyncio.wait_for(second.get(), 1) == expected
+    assert bus.subscriptions == 1
+
+    hub.unsubscribe("job-1", first)
+    hub.unsubscribe("job-1", second)
+    await asyncio.sleep(0)
+    assert not hub._dispatchers
+
+    await hub.close()
+
+
+@pytest.mark.asyncio
+async def test_heartbeat_wakes_every_waiter_from_one_ticker():
+    hub = PubSubHub(StubBus(), heartbeat_interval=0.01)
+    heartbeat = hub.heartbeat()
+
+    waiters = [asyncio.create_task(heartbeat.wait()) for _ in range(3)]
+    await asyncio.wait_for(asyncio.gather(*waiters), 1)
+
+    assert hub.heartbeat() is heartbeat
+    assert not heartbeat.is_set()
+
+    await hub.close()
+
+
+def test_subscriber_queue_drops_oldest_when_full():
+    queue = SubscriberQueue(maxsize=2)
+    for index in range(3):
+        queue.offer(("event", {"index": index}, ""))
+    queue.offer(("closed", {}, ""))
+
+    assert queue.dropped == 2
+    assert queue.get_nowait() == ("event", {"index": 2}, "")
+    assert queue.get_nowait() == ("closed", {}, "")
+
+
+@pytest.mark.asyncio
+async def test_heartbeat_ticker_goes_idle_without_subscribers():
+    hub = PubSubHub(StubBus(), heartbeat_interval=0.01)
+    queue = hub.subscribe("job-1")
+    heartbeat = hub.heartbeat()
+
+    await asyncio.wait_for(heartbeat.wait(), 1)
+    assert hub._ticker is not None
+
+    hub.unsubscribe("job-1", queue)
+    await asyncio.wait_for(heartbeat.wait(), 1)
+    assert hub._ticker is None
+
+    await hub.close()
+
+
+@pytest.mark.asyncio
+async def test_ticker_checks_status_once_per_job():
+    lookups = []
+
+    async def status_lookup(job_id):
+        lookups.append(job_id)
+        return "completed"
+
+    hub = PubSubHub(StubBus(), heartbeat_interval=0.01, status_lookup=status_lookup)
+    first = hub.subscribe("job-1")
+    second = hub.subscribe("job-1")
+    heartbeat = hub.heartbeat()
+
+    await asyncio.wait_for(heartbeat.wait(), 1)
+    expected = ("status", {"status": "completed"}, "")
+    assert await asyncio.wait_for(first.get(), 1) == expected
+    assert await asyncio.wait_for(second.get(), 1) == expected
+    assert lookups == ["job-1"]
+
+    await hub.close()
@@ -0,0 +1,39 @@
+"""Tests for the runtime stream concurrency setting."""
+
+import pytest
+from fastapi import FastAPI
+from httpx import AsyncClient
+
+from apps.api.routers import sse
+from apps.api.routers.auth import get_current_active_superuser
+
+
+@pytest.fixture
+def app(monkeypatch):
+    monkeypatch.setattr(sse, "stream_admission", sse.AdmissionController(c_max=2))
+    app = FastAPI()
+    app.include_router(sse.router, prefix="/api/sse")
+    app.dependency_overrides[get_current_active_superuser] = lambda: object()
+    return app
+
+
+@pytest.mark.asyncio
+async def test_update_stream_concurrency_resizes_admission(app):
+    async with AsyncClient(app=app, base_url="http://testserver") as client:
+        response = await client.put("/api/sse/settings/concurrency", json={"c_max": 5})
+        current = await client.get("/api/sse/settings/concurrency")
+
+    assert response.status_code == 200
+    assert response.json() == {"c_max": 5, "active": 0}
+    assert current.json() == {"c_max": 5, "active": 0}
+    assert sse.stream_admission.c_max == 5
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("c_max", [0, -1, sse.MAX_STREAM_CONCURRENCY + 1])
+async def test_update_stream_concurrency_rejects_invalid_caps(app, c_max):
+    async with AsyncClient(app=app, base_url="http://testserver") as client:
+        response = await client.put("/api/sse/settings/concurrency", json={"c_max": c_max})
+
+    assert response.status_code == 422
+    assert sse.stream_admission.c_max == 2
@@ -1,6 +1,8 @@
+import httpx
 import pytest
 
 from core.tickets.service import TicketService
+from core.tickets.settings import TicketToggleState
 
 
 @pytest.fixture(scope="module")
@@ -41,3 +43,28 @@ def test_jira_defaults_labels_and_priority(ticket_service: TicketService) -> Non
     assert defaults["priority"] in {"High", "Highest"}
     assert "Redeploy patched build" in defaults["description"]
     assert set(defaults["labels"]) >= {"api", "memory", "incident"}
+
+
+@pytest.mark.asyncio
+async def test_dispatch_reports_failed_platform_and_keeps_others(
+    ticket_service: TicketService, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    async def toggles():
+        return TicketToggleState(servicenow_enabled=True, jira_enabled=True, dual_mode=False)
+
+    async def job_context(job_id):
+        return {}
+
+    async def create_ticket(job_id, platform, payload, **kwargs):
+        if platform == "jira":
+            raise httpx.ConnectTimeout("timed out")
+        return platform
+
+    monkeypatch.setattr(ticket_service, "_get_toggle_state", toggles)
+    monkeypatch.setattr(ticket_service, "_load_job_context", job_context)
+    monkeypatch.setattr(ticket_service, "create_ticket", create_ticket)
+
+    result = await ticket_service.create_enabled_tickets("job-1")
+
+    assert result.tickets == ["servicenow"]
+    assert result.errors == {"jira": "timed out"}
@@ -0,0 +1,28 @@
+"""Tests for the in-process watcher event bus."""
+
+import asyncio
+
+import pytest
+
+from core.watchers.event_bus import WatcherEventBus
+
+
+@pytest.mark.asyncio
+async def test_local_subscribers_share_one_envelope():
+    bus = WatcherEventBus()
+    bus._redis_enabled = False
+
+    first = bus.subscribe_envelopes()
+    second = bus.subscribe_envelopes()
+    first_read = asyncio.ensure_future(first.__anext__())
+    second_read = asyncio.ensure_future(second.__anext__())
+    await asyncio.sleep(0)
+
+    await bus.publish({"event_type": "file-detected", "path": "/tmp/a.log"})
+    envelopes = await asyncio.gather(first_read, second_read)
+
+    assert envelopes[0] is envelopes[1]
+    assert envelopes[0].payload == {"event_type": "file-detected", "path": "/tmp/a.log"}
+
+    await first.aclose()
+    await second.aclose()